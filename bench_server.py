@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Teste de carga do server.py: throughput e latência com tráfego misto
+
+Abre N conexões keep-alive (uma thread por conexão) que repetem, durante o
+tempo pedido, uma mistura de arquivos estáticos do frontend e rotas da API.
+No final mostra requisições por segundo e latências p50/p99 por tipo de rota.
+O servidor precisa estar rodando (python server.py).
+
+Uso: python bench_server.py [--url http://localhost:8080] [--connections 16]
+                            [--duration 10] [--api-ratio 0.5]
+"""
+
+import argparse
+import http.client
+import random
+import sys
+import threading
+import time
+import urllib.parse
+
+STATIC_PATHS = ('/', '/index.html', '/js/app.js', '/js/bridge.js', '/assets/icons/icon.png')
+API_PATHS = ('/api/status', '/api/results')
+
+def percentile(values, fraction):
+    """Percentil por posição em uma lista já ordenada"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+class Client(threading.Thread):
+    """Uma conexão persistente repetindo requisições até o prazo"""
+
+    def __init__(self, host, port, deadline, api_ratio, seed):
+        super().__init__(daemon=True)
+        self.host = host
+        self.port = port
+        self.deadline = deadline
+        self.api_ratio = api_ratio
+        self.random = random.Random(seed)
+        self.latencies = {'static': [], 'api': []}
+        self.errors = 0
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+        return http.client.HTTPConnection(self.host, self.port, timeout=10)
+
+    def run(self):
+        conn = self.connect()
+        while time.perf_counter() < self.deadline:
+            kind = 'api' if self.random.random() < self.api_ratio else 'static'
+            path = self.random.choice(API_PATHS if kind == 'api' else STATIC_PATHS)
+            started = time.perf_counter()
+            try:
+                conn.request('GET', path)
+                response = conn.getresponse()
+                response.read()
+                if response.status >= 500:
+                    self.errors += 1
+                    continue
+                self.latencies[kind].append(time.perf_counter() - started)
+                if response.will_close:
+                    conn.close()
+                    conn = self.connect()
+            except (OSError, http.client.HTTPException):
+                self.errors += 1
+                conn.close()
+                conn = self.connect()
+        conn.close()
+
+def run_benchmark(url, connections, duration, api_ratio):
+    """Executa a carga e devolve latências por tipo, erros, conexões abertas e duração"""
+    parts = urllib.parse.urlsplit(url)
+    deadline = time.perf_counter() + duration
+    clients = [Client(parts.hostname, parts.port or 80, deadline, api_ratio, seed)
+               for seed in range(connections)]
+    started = time.perf_counter()
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = {'static': [], 'api': []}
+    for client in clients:
+        for kind, values in client.latencies.items():
+            latencies[kind].extend(values)
+    return (latencies, sum(client.errors for client in clients),
+            sum(client.connects for client in clients), elapsed)
+
+def print_report(latencies, errors, connects, elapsed):
+    total = sum(len(values) for values in latencies.values())
+    print(f"📊 {total} requisições em {elapsed:.1f}s: {total / elapsed:.0f} req/s "
+          f"| {connects} conexão(ões) TCP | {errors} erro(s)")
+    for kind, values in list(latencies.items()) + [('total', sum(latencies.values(), []))]:
+        values.sort()
+        if not values:
+            continue
+        print(f"   {kind:<7} {len(values):>7} req  {len(values) / elapsed:>7.0f} req/s  "
+              f"p50 {percentile(values, 0.50) * 1000:6.1f}ms  p99 {percentile(values, 0.99) * 1000:6.1f}ms  "
+              f"máx {values[-1] * 1000:6.1f}ms")
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test for server.py (mixed static and API traffic)')
+    parser.add_argument('--url', default='http://localhost:8080', help='Server base URL')
+    parser.add_argument('--connections', type=int, default=16, help='Concurrent keep-alive connections')
+    parser.add_argument('--duration', type=float, default=10, help='Test duration in seconds')
+    parser.add_argument('--api-ratio', type=float, default=0.5, help='Fraction of requests to the API (0-1)')
+    args = parser.parse_args()
+
+    print(f"🚀 {args.connections} conexão(ões) por {args.duration:.0f}s contra {args.url} "
+          f"({args.api_ratio:.0%} API)")
+    latencies, errors, connects, elapsed = run_benchmark(args.url, args.connections, args.duration, args.api_ratio)
+    if not any(latencies.values()):
+        print("❌ Nenhuma requisição concluída; o servidor está rodando?")
+        return 1
+    print_report(latencies, errors, connects, elapsed)
+    return 1 if errors else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
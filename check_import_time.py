@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Orçamento de tempo de importação dos módulos do scanner
+
+Importa cada módulo em um interpretador novo, dentro de um diretório vazio e
+sem GITHUB_TOKEN, e mede o tempo acumulado com -X importtime (mediana de
+várias execuções). Falha se o tempo passar do orçamento, se a importação
+terminar o processo, criar arquivos ou carregar bibliotecas que só devem ser
+importadas no primeiro uso da rede.
+
+Uso: python check_import_time.py [módulo ...]
+Orçamento: IMPORT_BUDGET_MS (padrão 50), IMPORT_RUNS (padrão 7)
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+DEFAULT_MODULES = ('github_scan',)
+
+# Carregados apenas na primeira requisição ou ao ler o .env
+LAZY_MODULES = ('requests', 'urllib3', 'httpx', 'dotenv')
+
+def measure(module, cwd, env):
+    """Uma importação em processo novo: (microssegundos, módulos lazy carregados, código de saída)"""
+    code = (f"import sys; import {module}; "
+            f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=cwd, env=env, capture_output=True, text=True)
+    elapsed = None
+    for line in result.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            elapsed = int(parts[1])
+    loaded = [m for m in result.stdout.strip().split(',') if m]
+    return elapsed, loaded, result.returncode
+
+def check(module, budget_ms, runs):
+    """Verifica o orçamento de um módulo e devolve a lista de problemas"""
+    env = {key: value for key, value in os.environ.items()
+           if key not in ('GITHUB_TOKEN', 'GITHUB_TOKENS')}
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(ROOT), env.get('PYTHONPATH')]))
+    env['PYTHONDONTWRITEBYTECODE'] = '1'
+
+    problems = []
+    timings = []
+    with tempfile.TemporaryDirectory() as cwd:
+        for _ in range(runs):
+            elapsed, loaded, returncode = measure(module, cwd, env)
+            if returncode != 0 or elapsed is None:
+                return [f'a importação terminou com código {returncode}']
+            timings.append(elapsed / 1000)
+        if loaded:
+            problems.append(f"carregou na importação: {', '.join(loaded)}")
+        created = os.listdir(cwd)
+        if created:
+            problems.append(f"criou arquivos na importação: {', '.join(created)}")
+
+    median = statistics.median(timings)
+    print(f"⏱️  {module}: mediana {median:.1f}ms (mín {min(timings):.1f}ms, máx {max(timings):.1f}ms) "
+          f"em {runs} importações | orçamento {budget_ms:.0f}ms")
+    if median > budget_ms:
+        problems.append(f'{median:.1f}ms acima do orçamento de {budget_ms:.0f}ms')
+    return problems
+
+def main():
+    modules = sys.argv[1:] or DEFAULT_MODULES
+    budget_ms = float(os.getenv('IMPORT_BUDGET_MS', '50'))
+    runs = int(os.getenv('IMPORT_RUNS', '7'))
+
+    failed = False
+    for module in modules:
+        for problem in check(module, budget_ms, runs):
+            print(f"❌ {module}: {problem}")
+            failed = True
+    if not failed:
+        print("✅ Importação dentro do orçamento e sem efeitos colaterais")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
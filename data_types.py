@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Classificação de termos por tipo de dado
+
+As regras ficam em uma tabela avaliada em ordem (a primeira que casa define o
+tipo), com as expressões regulares compiladas uma única vez. As versões
+minúscula e maiúscula do termo são calculadas uma vez por termo e o resultado
+é memoizado, então classificar o mesmo termo em cada página não custa nada.
+"""
+
+import re
+from functools import lru_cache
+
+# Termos memoizados; listas de breach dumps chegam a centenas de milhares
+CACHE_SIZE = 1 << 18
+
+_URL_PROTOCOLS = ('http://', 'https://', 'ftp://', 'ftps://')
+_GITHUB_TOKEN_PREFIXES = ('ghp_', 'gho_', 'ghu_', 'ghs_', 'ghr_')
+_API_KEY_PREFIXES = ('sk-', 'pk_')  # Stripe, OpenAI
+_DATABASE_SCHEMES = ('mongodb://', 'mysql://', 'postgresql://', 'redis://')
+_PASSWORD_KEYWORDS = ('password', 'passwd', 'pwd')
+_NOT_SECRET_KEYWORDS = ('key', 'token', 'api')
+_API_KEY_KEYWORDS = ('api_key', 'apikey', 'token', 'key')
+
+_AWS_SECRET_RE = re.compile(r'^[A-Za-z0-9+/=]+$')
+_ALNUM_KEY_RE = re.compile(r'^[A-Za-z0-9]{20,}$')
+
+def _contains_any(text, keywords):
+    return any(keyword in text for keyword in keywords)
+
+# (tipo, regra(term, lower, upper)) em ordem de prioridade
+RULES = (
+    ('email', lambda t, lower, upper: '@' in t and '.' in t and not lower.startswith(('http', 'ftp'))),
+    ('url', lambda t, lower, upper: lower.startswith(_URL_PROTOCOLS)),
+    ('url', lambda t, lower, upper: '.' in t and '/' in t and '@' not in t),
+    ('aws_key', lambda t, lower, upper: upper.startswith('AKIA')),
+    ('aws_secret', lambda t, lower, upper: len(t) == 40 and _AWS_SECRET_RE.match(t) is not None),
+    ('github_token', lambda t, lower, upper: lower.startswith(_GITHUB_TOKEN_PREFIXES)),
+    ('api_key', lambda t, lower, upper: lower.startswith(_API_KEY_PREFIXES)),
+    ('bearer_token', lambda t, lower, upper: lower.startswith('bearer ')),
+    ('jwt_token', lambda t, lower, upper: len(t) > 50 and t.count('.') == 2),
+    ('database_url', lambda t, lower, upper: _contains_any(lower, _DATABASE_SCHEMES)),
+    ('password', lambda t, lower, upper: _contains_any(lower, _PASSWORD_KEYWORDS)),
+    ('password', lambda t, lower, upper: 'secret' in lower and not _contains_any(lower, _NOT_SECRET_KEYWORDS)),
+    ('api_key', lambda t, lower, upper: len(t) > 10 and _contains_any(lower, _API_KEY_KEYWORDS)),
+    ('api_key', lambda t, lower, upper: _ALNUM_KEY_RE.match(t) is not None),
+)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def classify(term):
+    """Tipo de dado do termo pela primeira regra da tabela que casar"""
+    lower = term.lower()
+    upper = term.upper()
+    for data_type, rule in RULES:
+        if rule(term, lower, upper):
+            return data_type
+    return 'generic'
+
+def classify_many(terms):
+    """Tipos de uma lista de termos em uma passada, classificando cada termo distinto uma vez"""
+    return [classify(term) for term in terms]
+
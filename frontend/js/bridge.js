@@ -132,7 +132,7 @@ async function handleResultFileSelect(event) {
     
     try {
         const content = await readFileContent(file);
-        const results = JSON.parse(content);
+        const results = parseResultFile(content);
         
         // Process and display results
         displayResults(results);
@@ -144,6 +144,20 @@ async function handleResultFileSelect(event) {
     }
 }
 
+// Parse a results file: NDJSON events from run_frontend_scan.py or the legacy JSON with the raw output
+function parseResultFile(content) {
+    try {
+        const results = JSON.parse(content);
+        if (!results.type) {
+            return results;
+        }
+    } catch (error) {
+        // More than one line: NDJSON
+    }
+    const lines = content.split('\n').filter(line => line.trim());
+    return { events: lines.map(line => JSON.parse(line)) };
+}
+
 // Read file content
 function readFileContent(file) {
     return new Promise((resolve, reject) => {
@@ -158,7 +172,7 @@ function readFileContent(file) {
 function displayResults(results) {
     const resultsDisplay = document.getElementById('resultsDisplay');
     
-    if (!results || !results.output) {
+    if (!results || (!results.events && !results.output)) {
         resultsDisplay.innerHTML = `
             <div class="bg-gray-800 rounded-xl border border-git-border p-6 text-center">
                 <i class="fas fa-exclamation-circle text-git-accent text-4xl mb-4"></i>
@@ -169,8 +183,8 @@ function displayResults(results) {
         return;
     }
     
-    // Parse the output for structured results
-    const parsedResults = parseResults(results.output);
+    // Group the result records by term (legacy files only have the raw output)
+    const parsedResults = results.events ? groupRecords(results.events) : parseResults(results.output);
     
     if (parsedResults.length === 0) {
         resultsDisplay.innerHTML = `
@@ -194,6 +208,25 @@ function displayResults(results) {
     resultsDisplay.innerHTML = resultsHtml;
 }
 
+// Group result events by term, keeping the order in which terms finished
+function groupRecords(events) {
+    const groups = new Map();
+    for (const event of events) {
+        if (event.type !== 'result' && event.type !== 'term') continue;
+        if (!groups.has(event.term)) {
+            groups.set(event.term, { term: event.term, items: [] });
+        }
+        if (event.type === 'result') {
+            groups.get(event.term).items.push({
+                repo: event.repository,
+                path: event.path,
+                url: event.url
+            });
+        }
+    }
+    return Array.from(groups.values());
+}
+
 // Parse raw results into structured format
 function parseResults(output) {
     const results = [];
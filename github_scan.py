@@ -1,94 +1,187 @@
-import requests
-import time
 import os
-from dotenv import load_dotenv
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from token_pool import TokenPool, TokensRevoked
+from transport import create_transport
+from data_types import classify, classify_many
+from http_cache import HTTPCache
+from result_cache import ResultCache, token_scope
+from result_records import NDJSONSink, records_from_page
+from pagination import MAX_PER_PAGE, PagePlan, PaginationCursor, SEARCH_RESULT_CAP, parse_link_header
+from partition import QueryPartitioner
+from query_planner import QueryPlan, canonical_query
+from query_validator import QueryDenylist, prune_queries
+from strategy_stats import StrategyStats, strategy_key
+from term_source import Checkpoint, iter_terms
+from term_batching import TEXT_MATCH_ACCEPT, assign_items, batch_terms, build_batch_query, is_batchable
 import datetime
 
-load_dotenv(dotenv_path='.env', override=True, verbose=True)
+# Nomes publicados por set_default_scanner; acessá-los cria o scanner padrão
+CONFIG_GLOBALS = ('TOKEN', 'TOKENS', 'SEARCH_TERMS', 'RESULTS_PER_PAGE', 'PAGES', 'SLEEP_TIME',
+                  'START_DATE', 'END_DATE', 'headers')
 
-def reload_env_config():
-    """Força o recarregamento das variáveis de ambiente do arquivo .env"""
-    print("Recarregando configurações do arquivo .env...")
-    load_dotenv(dotenv_path='.env', override=True, verbose=False)
+# Scanner das funções do módulo, criado a partir do .env no primeiro uso
+_default_scanner = None
+
+def parse_tokens(values=None):
+    """Lê GITHUB_TOKEN e GITHUB_TOKENS (separados por vírgula) sem duplicatas"""
+    values = os.environ if values is None else values
+    raw = f"{values.get('GITHUB_TOKEN') or ''},{values.get('GITHUB_TOKENS') or ''}"
+    return list(dict.fromkeys(t.strip() for t in raw.split(',') if t.strip()))
+
+def default_checkpoint(terms_file):
+    """Checkpoint ao lado do arquivo de termos (o stdin não tem checkpoint por padrão)"""
+    return f'{terms_file}.checkpoint' if terms_file and terms_file != '-' else ''
+
+class ScanConfig:
+    """Configuração explícita de um scan, independente de .env e de variáveis globais"""
+    
+    def __init__(self, tokens, search_terms=(), results_per_page=30, pages=5, sleep_time=2,
+                 start_date=None, end_date=None, concurrency=4, strategy_fanout=1,
+                 http_backend='requests', adaptive_paging=True, partition_large_results=False,
+                 partition_max_requests=200, batch_terms=False, search_terms_file='',
+                 terms_checkpoint=None, results_ndjson='', http_cache_dir='.cache/http',
+                 http_cache_max_entries=5000, http_cache_max_age=604800,
+                 result_cache_path='.cache/results.sqlite3', result_cache_ttl=21600,
+                 result_cache_empty_ttl=3600, result_cache_invalid_ttl=3600,
+                 result_cache_max_entries=2000, strategy_stats_path='.cache/strategy_stats.sqlite3',
+                 query_denylist_path='.cache/query_denylist.sqlite3'):
+        self.tokens = [tokens] if isinstance(tokens, str) else list(tokens)
+        self.search_terms = list(search_terms)
+        self.results_per_page = results_per_page
+        self.pages = pages
+        self.sleep_time = sleep_time
+        self.start_date = start_date
+        self.end_date = end_date
+        self.concurrency = concurrency
+        self.strategy_fanout = strategy_fanout
+        self.http_backend = http_backend
+        self.adaptive_paging = adaptive_paging
+        self.partition_large_results = partition_large_results
+        self.partition_max_requests = partition_max_requests
+        self.batch_terms = batch_terms
+        self.search_terms_file = search_terms_file
+        self.terms_checkpoint = default_checkpoint(search_terms_file) if terms_checkpoint is None else terms_checkpoint
+        self.results_ndjson = results_ndjson
+        self.http_cache_dir = http_cache_dir
+        self.http_cache_max_entries = http_cache_max_entries
+        self.http_cache_max_age = http_cache_max_age
+        self.result_cache_path = result_cache_path
+        self.result_cache_ttl = result_cache_ttl
+        self.result_cache_empty_ttl = result_cache_empty_ttl
+        self.result_cache_invalid_ttl = result_cache_invalid_ttl
+        self.result_cache_max_entries = result_cache_max_entries
+        self.strategy_stats_path = strategy_stats_path
+        self.query_denylist_path = query_denylist_path
+    
+    @property
+    def token(self):
+        return self.tokens[0] if self.tokens else None
     
-    global TOKEN, SEARCH_TERMS, RESULTS_PER_PAGE, PAGES, SLEEP_TIME, START_DATE, END_DATE, headers
+    @classmethod
+    def from_mapping(cls, values):
+        """Configuração a partir de um dicionário com os nomes das variáveis do .env"""
+        def get(name, default):
+            value = values.get(name)
+            return default if value is None or value == '' else str(value)
     
-    TOKEN = os.getenv('GITHUB_TOKEN')
-    SEARCH_TERMS = [t.strip() for t in os.getenv('SEARCH_TERM', '').split(',') if t.strip()]
-    RESULTS_PER_PAGE = int(os.getenv('RESULTS_PER_PAGE', '30'))
-    PAGES = int(os.getenv('PAGES', '5'))
-    SLEEP_TIME = int(os.getenv('SLEEP_TIME', '2'))
-    START_DATE = os.getenv('START_DATE')
-    END_DATE = os.getenv('END_DATE')
+        return cls(
+            tokens=parse_tokens(values),
+            search_terms=[t.strip() for t in get('SEARCH_TERM', '').split(',') if t.strip()],
+            results_per_page=int(get('RESULTS_PER_PAGE', '30')),
+            pages=int(get('PAGES', '5')),
+            sleep_time=int(get('SLEEP_TIME', '2')),
+            start_date=get('START_DATE', None),
+            end_date=get('END_DATE', None),
+            concurrency=int(get('CONCURRENCY', '4')),
+            strategy_fanout=int(get('STRATEGY_FANOUT', '1')),
+            http_backend=get('HTTP_BACKEND', 'requests'),
+            adaptive_paging=get('ADAPTIVE_PAGING', '1') == '1',
+            partition_large_results=get('PARTITION_LARGE_RESULTS', '0') == '1',
+            partition_max_requests=int(get('PARTITION_MAX_REQUESTS', '200')),
+            batch_terms=get('BATCH_TERMS', '0') == '1',
+            search_terms_file=get('SEARCH_TERMS_FILE', ''),
+            terms_checkpoint=values.get('TERMS_CHECKPOINT'),
+            results_ndjson=get('RESULTS_NDJSON', ''),
+            # Caminhos vazios desativam o cache correspondente
+            http_cache_dir=values.get('HTTP_CACHE_DIR', '.cache/http'),
+            http_cache_max_entries=int(get('HTTP_CACHE_MAX_ENTRIES', '5000')),
+            http_cache_max_age=int(get('HTTP_CACHE_MAX_AGE', '604800')),
+            result_cache_path=values.get('RESULT_CACHE_PATH', '.cache/results.sqlite3'),
+            result_cache_ttl=int(get('RESULT_CACHE_TTL', '21600')),
+            result_cache_empty_ttl=int(get('RESULT_CACHE_EMPTY_TTL', '3600')),
+            result_cache_invalid_ttl=int(get('RESULT_CACHE_INVALID_TTL', '3600')),
+            result_cache_max_entries=int(get('RESULT_CACHE_MAX_ENTRIES', '2000')),
+            strategy_stats_path=values.get('STRATEGY_STATS_PATH', '.cache/strategy_stats.sqlite3'),
+            query_denylist_path=values.get('QUERY_DENYLIST_PATH', '.cache/query_denylist.sqlite3'),
+        )
     
-    headers = {
-        'Authorization': f'token {TOKEN}',
-        'Accept': 'application/vnd.github.v3+json'
-    }
+    @classmethod
+    def from_env(cls, overrides=None):
+        """Configuração das variáveis de ambiente atuais, com overrides opcionais (sem ler arquivos)"""
+        return cls.from_mapping({**os.environ, **(overrides or {})})
     
-    print(f"Configurações atualizadas: {len(SEARCH_TERMS)} termo(s) de busca")
-    return TOKEN is not None
+    def date_range(self):
+        """Qualificador de data da busca, ou None sem START_DATE/END_DATE"""
+        if not (self.start_date and self.end_date):
+            return None
+        if self.start_date >= '2008-01-01':
+            return f'pushed:{self.start_date}..{self.end_date}'
+        return f'created:{self.start_date}..{self.end_date}'
 
-# === CONFIGURAÇÕES ===
-TOKEN = os.getenv('GITHUB_TOKEN')
-SEARCH_TERMS = [t.strip() for t in os.getenv('SEARCH_TERM', '').split(',') if t.strip()]
-RESULTS_PER_PAGE = int(os.getenv('RESULTS_PER_PAGE', '30'))
-PAGES = int(os.getenv('PAGES', '5'))
-SLEEP_TIME = int(os.getenv('SLEEP_TIME', '2'))
-START_DATE = os.getenv('START_DATE')
-END_DATE = os.getenv('END_DATE')
+def load_env_file(verbose=False):
+    """Carrega o arquivo .env nas variáveis de ambiente (o python-dotenv só é importado aqui)"""
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path='.env', override=True, verbose=verbose)
 
-if not TOKEN:
-    print("❌ ERRO: Token do GitHub não configurado!")
-    print("Configure seu token no arquivo .env")
-    print("Obtenha um token em: https://github.com/settings/tokens")
-    exit(1)
+def reload_env_config():
+    """Força o recarregamento das variáveis de ambiente do arquivo .env"""
+    print("Recarregando configurações do arquivo .env...")
+    load_env_file()
+
+    config = ScanConfig.from_env()
+    set_default_scanner(Scanner(config))
+
+    print(f"Configurações atualizadas: {len(config.search_terms)} termo(s) de busca, {len(config.tokens)} token(s)")
+    return config.token is not None
 
-headers = {
-    'Authorization': f'token {TOKEN}',
-    'Accept': 'application/vnd.github.v3+json'
-}
+def set_default_scanner(scanner):
+    """Define o scanner usado pelas funções do módulo e publica sua configuração nos globais"""
+    global _default_scanner, TOKEN, TOKENS, SEARCH_TERMS, RESULTS_PER_PAGE, PAGES, SLEEP_TIME, START_DATE, END_DATE, headers
+
+    if _default_scanner is not None:
+        _default_scanner.close()
+    _default_scanner = scanner
+    config = scanner.config
+    TOKENS = config.tokens
+    TOKEN = config.token
+    SEARCH_TERMS = config.search_terms
+    RESULTS_PER_PAGE = config.results_per_page
+    PAGES = config.pages
+    SLEEP_TIME = config.sleep_time
+    START_DATE = config.start_date
+    END_DATE = config.end_date
+    headers = scanner.headers
+
+def default_scanner():
+    """Scanner configurado pelo .env, usado pelas funções do módulo (criado no primeiro uso)"""
+    if _default_scanner is None:
+        load_env_file(verbose=True)
+        set_default_scanner(Scanner(ScanConfig.from_env()))
+    return _default_scanner
+
+def __getattr__(name):
+    """Configuração do scanner padrão como globais do módulo, lida só quando acessada"""
+    if name in CONFIG_GLOBALS:
+        default_scanner()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def detect_data_type(term):
     """Detecta o tipo de dado baseado no padrão do termo"""
-    import re
-    
-    if '@' in term and '.' in term and not term.lower().startswith(('http', 'ftp')):
-        return 'email'
-    if any(term.lower().startswith(proto) for proto in ['http://', 'https://', 'ftp://', 'ftps://']):
-        return 'url'
-    if term.count('.') >= 1 and '/' in term and not '@' in term:
-        return 'url'
-    
-    if term.upper().startswith('AKIA'):  # AWS Access Key
-        return 'aws_key'
-    if len(term) == 40 and re.match(r'^[A-Za-z0-9+/=]+$', term):  # AWS Secret Key pattern
-        return 'aws_secret'
-    
-    if term.lower().startswith(('ghp_', 'gho_', 'ghu_', 'ghs_', 'ghr_')):  # GitHub tokens
-        return 'github_token'
-    if term.lower().startswith(('sk-', 'pk_')):  # Stripe, OpenAI patterns
-        return 'api_key'
-    if term.lower().startswith('bearer '):
-        return 'bearer_token'
-    
-    if term.count('.') == 2 and len(term) > 50:
-        return 'jwt_token'
-    
-    if any(db in term.lower() for db in ['mongodb://', 'mysql://', 'postgresql://', 'redis://']):
-        return 'database_url'
-    
-    if any(keyword in term.lower() for keyword in ['password', 'passwd', 'pwd']):
-        return 'password'
-    if 'secret' in term.lower() and not any(kw in term.lower() for kw in ['key', 'token', 'api']):
-        return 'password'
-    
-    if any(keyword in term.lower() for keyword in ['api_key', 'apikey', 'token', 'key']) and len(term) > 10:
-        return 'api_key'
-    if re.match(r'^[A-Za-z0-9]{20,}$', term):
-        return 'api_key'
-    
-    return 'generic'
+    return classify(term)
 
 def generate_search_queries(term, data_type):
     """Gera queries de busca específicas para cada tipo de dado"""
@@ -182,116 +275,805 @@ def generate_search_queries(term, data_type):
     
     return queries
 
-def search_github(term, page, date_range=None):
-    """Busca no GitHub com estratégias inteligentes baseadas no tipo de dado"""
+def build_search_url(query, page=None, per_page=None):
+    """Monta a URL da API de busca de código para uma query"""
     import urllib.parse
     
-    data_type = detect_data_type(term)
-    print(f"🔍 Tipo detectado: {data_type.upper()}")
-    
-    queries = generate_search_queries(term, data_type)
-    
-    if date_range:
-        test_query = f'{queries[0]} {date_range}'
-        encoded_test = urllib.parse.quote(test_query)
-        test_url = f'https://api.github.com/search/code?q={encoded_test}&per_page=1'
-        
-        print(f"🗒️ Testando filtro de data...")
-        test_response = requests.get(test_url, headers=headers)
-        
+    url = f'https://api.github.com/search/code?q={urllib.parse.quote(query)}'
+    if page is not None:
+        url += f'&page={page}'
+    if per_page is not None:
+        url += f'&per_page={per_page}'
+    return url
+
+class Scanner:
+    """Scanner com configuração e recursos próprios (tokens, conexões, caches, estado por termo)
+    
+    Instâncias diferentes não compartilham estado mutável, então vários scans com
+    tokens diferentes podem rodar ao mesmo tempo no mesmo processo.
+    """
+    
+    def __init__(self, config, transport=None):
+        self.config = config
+        self.headers = {
+            'Authorization': f'token {config.token}',
+            'Accept': 'application/vnd.github.v3+json'
+        }
+        self.token_pool = TokenPool(config.tokens, fallback_wait=config.sleep_time) if config.tokens else None
+        # Conexões (e a biblioteca HTTP) só são criadas na primeira requisição. Um transporte
+        # recebido pronto é compartilhado (o token vai em cada requisição) e não é fechado aqui
+        self._transport = transport
+        self._owns_transport = transport is None
+        self._transport_lock = threading.Lock()
+        self.http_cache = HTTPCache(
+            config.http_cache_dir,
+            max_entries=config.http_cache_max_entries,
+            max_age=config.http_cache_max_age,
+        ) if config.http_cache_dir else None
+        self.result_cache = self.create_result_cache()
+        self.strategy_stats = StrategyStats(config.strategy_stats_path) if config.strategy_stats_path else None
+        self.query_denylist = QueryDenylist(config.query_denylist_path) if config.query_denylist_path else None
+    
+        # Resultado do teste de filtro de data por (termo, período), válido durante o scan
+        self.date_filter_cache = {}
+        self._date_filter_lock = threading.Lock()
+        # Estratégia (tipo de dado, template) de cada query gerada, para as estatísticas
+        self.strategy_keys = {}
+        # Cursores de paginação de search_github por (termo, período)
+        self._cursors = {}
+    
+    @property
+    def transport(self):
+        """Transporte HTTP do scanner, criado no primeiro uso"""
+        if self._transport is None:
+            with self._transport_lock:
+                if self._transport is None:
+                    config = self.config
+                    self._transport = create_transport(config.http_backend, self.headers, pool_size=config.concurrency)
+        return self._transport
+    
+    @property
+    def request_stats(self):
+        """Estatísticas do transporte, ou None se nenhuma requisição criou um"""
+        return self._transport.stats if self._transport is not None else None
+    
+    def create_result_cache(self):
+        """Cria o cache de resultados a partir da configuração RESULT_CACHE_*"""
+        config = self.config
+        if not config.result_cache_path:
+            return None
+        return ResultCache(
+            config.result_cache_path,
+            ttl=config.result_cache_ttl,
+            empty_ttl=config.result_cache_empty_ttl,
+            invalid_ttl=config.result_cache_invalid_ttl,
+            max_entries=config.result_cache_max_entries,
+            scope=token_scope(config.tokens),
+        )
+    
+    def close(self):
+        """Fecha as conexões e os bancos de cache do scanner"""
+        if self._transport is not None and self._owns_transport:
+            self._transport.close()
+        for store in (self.result_cache, self.strategy_stats, self.query_denylist):
+            if store:
+                store.close()
+    
+    def github_get(self, url, extra_headers=None):
+        """Executa um GET autenticado com o token de maior quota livre do pool"""
+        if self.token_pool is None:
+            raise ValueError("Nenhum token do GitHub configurado: defina GITHUB_TOKEN (ou ScanConfig(tokens=...))")
+        conditional = self.http_cache.conditional_headers(url) if self.http_cache else {}
+        request_headers = {**(extra_headers or {}), **conditional}
+        response = self.token_pool.request(
+            lambda token: self.transport.get(url, headers={'Authorization': f'token {token}', **request_headers})
+        )
+        return self.http_cache.resolve(url, response) if self.http_cache else response
+    
+    def probe_date_filter(self, term, date_range):
+        """Testa se o filtro de data retorna resultados para o termo (uma vez por scan)"""
+        key = (term, date_range)
+        with self._date_filter_lock:
+            if key in self.date_filter_cache:
+                return self.date_filter_cache[key]
+    
+        candidates, _ = prune_queries(term, generate_search_queries(term, detect_data_type(term)), self.query_denylist)
+        if not candidates:
+            return False
+        test_url = build_search_url(f'{candidates[0]} {date_range}', per_page=1)
+    
+        print(f"🗒️ Testando filtro de data para: {term}")
+        test_response = self.github_get(test_url)
+    
+        valid = False
         if test_response.status_code == 200:
             test_count = test_response.json().get('total_count', 0)
             if test_count > 0:
                 print(f"✅ Filtro de data válido: {test_count} resultados encontrados")
-                queries = [f'{q} {date_range}' for q in queries]
+                valid = True
             else:
                 print(f"⚠️  Filtro de data muito restritivo (0 resultados). Removendo filtro...")
                 print(f"Buscando em todo o histórico para melhor cobertura")
-                date_range = None  # Remove o filtro
         else:
             print(f"⚠️  Erro ao testar filtro de data: {test_response.status_code}")
             print(f"Continuando sem filtro de data")
-            date_range = None
-        
-        time.sleep(0.5)  # Pequena pausa após teste
-    
-    for i, query in enumerate(queries):
-        print(f"🔍 Tentativa {i+1}/{len(queries)} - Query: {query}")
-        
-        encoded_query = urllib.parse.quote(query)
-        url = f'https://api.github.com/search/code?q={encoded_query}&page={page}&per_page={RESULTS_PER_PAGE}'
-        
+    
+        with self._date_filter_lock:
+            self.date_filter_cache[key] = valid
+        return valid
+    
+    def apply_date_filter(self, term, queries, date_range):
+        """Aplica o filtro de data às queries se o teste (memoizado) for positivo"""
+        if date_range and self.probe_date_filter(term, date_range):
+            return [f'{q} {date_range}' for q in queries]
+        return queries
+    
+    def valid_queries(self, term, data_type):
+        """Estratégias do termo sem as inválidas, já negadas por 422 ou equivalentes entre si"""
+        queries, dropped = prune_queries(term, generate_search_queries(term, data_type), self.query_denylist)
+        if dropped:
+            print(f"🧹 {term}: {len(dropped)} estratégia(s) descartada(s) antes do envio")
+            for query, reason in dropped:
+                print(f"   ↪ {query} ({reason})")
+        return queries
+    
+    def strategy_queries(self, term, date_range=None):
+        """Queries do termo na ordem aprendida pelo histórico, com o filtro de data aplicado"""
+        data_type = detect_data_type(term)
+        queries = self.valid_queries(term, data_type)
+        if self.strategy_stats:
+            queries = self.strategy_stats.order(term, data_type, queries)
+        queries = self.apply_date_filter(term, queries, date_range)
+        for query in queries:
+            self.strategy_keys[query] = (data_type, strategy_key(term, query, date_range))
+        return queries
+    
+    def next_page_url(self, query, page, total_count, response=None, per_page=None):
+        """URL da página seguinte: o Link rel="next" da resposta ou, sem ele, a calculada"""
+        if response is not None:
+            links = parse_link_header(response.headers.get('Link'))
+            if 'next' in links or not getattr(response, 'from_cache', False):
+                return links.get('next')
+        per_page = per_page or self.config.results_per_page
+        if page * per_page < min(total_count, SEARCH_RESULT_CAP):
+            return build_search_url(query, page + 1, per_page)
+        return None
+    
+    def fetch_search_page(self, query, page, url=None, per_page=None):
+        """Busca uma página de uma query e devolve (status, itens, total_count, próxima URL)"""
+        per_page = per_page or self.config.results_per_page
+        if self.result_cache:
+            cached = self.result_cache.get(query, page, per_page)
+            if cached is not None:
+                status, items, total_count = cached
+                print(f"🗃️  Cache: status {status}, {len(items)} item(ns) de {total_count} para: {query}")
+                return status, items, total_count, self.next_page_url(query, page, total_count, per_page=per_page)
+    
+        url = url or build_search_url(query, page, per_page)
+    
         print(f"🌐 URL: {url}")
-        
-        response = requests.get(url, headers=headers)
+    
+        started = time.perf_counter()
+        response = self.github_get(url)
+        latency = time.perf_counter() - started
         print(f"📊 Status: {response.status_code}")
-        
+    
         if response.status_code == 200:
             data = response.json()
             total_count = data.get('total_count', 0)
             items = data.get('items', [])
+            self.record_strategy(query, page, 200, len(items), latency)
+            if self.query_denylist:
+                self.query_denylist.record(query, 200, self.strategy_of(query))
             print(f"📈 Total encontrado: {total_count}, Retornados nesta página: {len(items)}")
-            
-            if items:  # Se encontrou resultados, retorna
-                return items
-            else:
+            if not items:
                 print(f"🚫 Nenhum resultado para esta query, tentando próxima...")
-                
-        elif response.status_code == 403:
-            print(f"⚠️  Rate limit atingido. Aguarde um momento...")
+            if self.result_cache:
+                self.result_cache.put(query, page, per_page, 200, items, total_count)
+            return response.status_code, items, total_count, self.next_page_url(query, page, total_count, response, per_page)
+    
+        self.record_strategy(query, page, response.status_code, 0, latency)
+        if response.status_code == 403:
+            print(f"⚠️  Acesso negado mesmo após aguardar o rate limit")
             print(f"Detalhes: {response.headers.get('X-RateLimit-Remaining', 'N/A')} requests restantes")
-            return []
         elif response.status_code == 422:
             print(f"⚠️  Query inválida, tentando próxima...")
             print(f"Detalhes: {response.text}")
-            continue
+            if self.query_denylist:
+                self.query_denylist.record(query, 422, self.strategy_of(query))
+            if self.result_cache:
+                self.result_cache.put(query, page, per_page, 422, [])
         else:
             print(f"❌ Erro {response.status_code}: {response.text}")
-            continue
-            
-        # Pequena pausa entre tentativas
-        time.sleep(0.5)
+        return response.status_code, [], 0, None
+    
+    def strategy_of(self, query):
+        """Template da estratégia que gerou a query, se ela veio de strategy_queries"""
+        return self.strategy_keys[query][1] if query in self.strategy_keys else None
+    
+    def record_strategy(self, query, page, status, item_count, latency):
+        """Registra no histórico o resultado da primeira página de uma estratégia"""
+        if not self.strategy_stats or page != 1 or query not in self.strategy_keys:
+            return
+        data_type, key = self.strategy_keys[query]
+        self.strategy_stats.record(data_type, key, status, item_count, latency)
+    
+    def fetch_term_batch(self, terms):
+        """Busca um grupo de termos unidos por OR, com text-match; devolve (status, itens, total_count)"""
+        query = build_batch_query(terms)
+        url = build_search_url(query, 1, MAX_PER_PAGE)
+        print(f"📦 Grupo de {len(terms)} termo(s): {query}")
+    
+        response = self.github_get(url, {'Accept': TEXT_MATCH_ACCEPT})
+        if response.status_code != 200:
+            print(f"⚠️  Erro {response.status_code} no grupo, os termos serão buscados individualmente")
+            return response.status_code, [], 0
+        data = response.json()
+        return response.status_code, data.get('items', []), data.get('total_count', 0)
+    
+    def fetch_query_page(self, query, page):
+        """Busca uma página de uma query e devolve (status, itens)"""
+        status, items, _, _ = self.fetch_search_page(query, page)
+        return status, items
+    
+    def create_plan(self, pages=None):
+        """Plano de paginação para PAGES x RESULTS_PER_PAGE resultados por termo"""
+        config = self.config
+        return PagePlan(pages or config.pages, config.results_per_page, adaptive=config.adaptive_paging)
+    
+    def create_cursor(self, term, date_range=None, plan=None):
+        """Cria o cursor de paginação do termo com as queries já filtradas por data"""
+        return PaginationCursor(term, self.strategy_queries(term, date_range), plan or self.create_plan())
+    
+    def fetch_next_page(self, cursor):
+        """Próxima página do cursor: a primeira percorre as estratégias, as demais seguem o Link"""
+        if cursor.exhausted:
+            return []
+    
+        if not cursor.started:
+            for i, query in enumerate(cursor.queries):
+                print(f"🔍 Tentativa {i+1}/{len(cursor.queries)} - Query: {query}")
+                status, items, total_count, next_url = self.fetch_search_page(query, 1, per_page=cursor.per_page)
+                if items:
+                    return cursor.start(i, items, total_count, next_url)
+                if status == 403:
+                    break
+            print(f"🚫 Nenhuma das {len(cursor.queries)} estratégias de busca retornou resultados")
+            cursor.finish()
+            return []
+    
+        page = cursor.page + 1
+        print(f"➡️  Página {page}/{cursor.max_pages} de '{cursor.term}' com a estratégia {cursor.strategy_index + 1}: {cursor.query}")
+        status, items, total_count, next_url = self.fetch_search_page(cursor.query, page, cursor.next_url, cursor.per_page)
+        if not items:
+            cursor.finish()
+            return []
+        return cursor.advance(items, total_count, next_url)
+    
+    def walk_strategies(self, queries, page):
+        """Tenta as estratégias em ordem e devolve os itens da primeira que tiver resultados"""
+        for i, query in enumerate(queries):
+            print(f"🔍 Tentativa {i+1}/{len(queries)} - Query: {query}")
+    
+            status, items = self.fetch_query_page(query, page)
+    
+            if items:  # Se encontrou resultados, retorna
+                return items
+            if status == 403:
+                return []
+    
+        print(f"🚫 Nenhuma das {len(queries)} estratégias de busca retornou resultados")
+        return []
+    
+    def search_github(self, term, page, date_range=None):
+        """Busca no GitHub com estratégias inteligentes baseadas no tipo de dado"""
+        data_type = detect_data_type(term)
+        print(f"🔍 Tipo detectado: {data_type.upper()}")
+    
+        # Chamadas sequenciais (página 1, 2, ...) continuam o cursor do termo
+        key = (term, date_range)
+        if page == 1:
+            # Páginas de RESULTS_PER_PAGE como antes; o total_count evita a página vazia final
+            plan = PagePlan(max(self.config.pages, 1), self.config.results_per_page, adaptive=False)
+            self._cursors[key] = self.create_cursor(term, date_range, plan)
+        cursor = self._cursors.get(key)
+        if cursor is not None and cursor.exhausted and page > cursor.page:
+            return []  # O total_count já mostrou que não há mais páginas
+        if cursor is None or cursor.page != page - 1:
+            # Acesso fora de ordem: sem cursor, percorre as estratégias para esta página
+            return self.walk_strategies(self.strategy_queries(term, date_range), page)
+    
+        return self.fetch_next_page(cursor)
+    
+    def engine(self, concurrency=None, strategy_fanout=None):
+        """Motor assíncrono ligado a este scanner"""
+        return AsyncSearchEngine(concurrency, strategy_fanout, scanner=self)
+    
+    async def search_async(self, term, page, date_range=None, concurrency=None):
+        """API assíncrona: busca uma página de um termo"""
+        engine = self.engine(concurrency)
+        try:
+            return await engine.search(term, page, date_range)
+        finally:
+            engine.close()
     
-    print(f"🚫 Nenhuma das {len(queries)} estratégias de busca retornou resultados")
-    return []
+    def scan_iter(self, terms=None, pages=None, date_range=None, concurrency=None):
+        """API assíncrona: gera (termo, [itens por página]) conforme cada termo termina"""
+        terms = self.config.search_terms if terms is None else terms
+        return self.engine(concurrency).scan_iter(terms, pages or self.config.pages, date_range)
+    
+    def page_event(self, cursor, page, items):
+        """Evento de progresso de uma página recebida, com a quota de busca restante"""
+        return {'type': 'page', 'term': cursor.term, 'page': page, 'items': len(items),
+                'total_count': cursor.total_count, 'quota_remaining': self.token_pool.remaining() if self.token_pool else None}
+    
+    async def scan_events(self, terms=None, pages=None, date_range=None, concurrency=None, progress=False):
+        """API assíncrona: gera os eventos do scan conforme cada termo termina
+    
+        Um evento 'result' por item (campos de ResultRecord) e, depois deles, um
+        evento 'term' com os contadores do termo. Com progress, também um evento
+        'page' assim que cada página de um termo chega.
+        """
+        events = asyncio.Queue()
+        engine = self.engine(concurrency)
+        if progress:
+            engine.on_page = lambda cursor, page, items: events.put_nowait(self.page_event(cursor, page, items))
+        terms = self.config.search_terms if terms is None else terms
+    
+        async def produce():
+            results = engine.scan_iter(terms, pages or self.config.pages, date_range)
+            try:
+                async for term, term_pages in results:
+                    data_type = detect_data_type(term)
+                    found = 0
+                    for page, items in enumerate(term_pages, 1):
+                        for record in records_from_page(term, data_type, page, items):
+                            found += 1
+                            events.put_nowait({'type': 'result', **record._asdict()})
+                    events.put_nowait({'type': 'term', 'term': term, 'data_type': data_type,
+                                       'results': found, 'pages': len(term_pages)})
+            finally:
+                await results.aclose()
+                events.put_nowait(None)
+    
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
+            await producer  # Propaga um erro do scan
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+    
+    async def scan_async(self, terms=None, pages=None, date_range=None, concurrency=None):
+        """API assíncrona: busca várias páginas de vários termos em paralelo"""
+        terms = self.config.search_terms if terms is None else terms
+        return await self.engine(concurrency).scan(terms, pages or self.config.pages, date_range)
+    
+    def scan(self, terms=None, pages=None, date_range=None, concurrency=None):
+        """Wrapper síncrono de scan_async"""
+        return asyncio.run(self.scan_async(terms, pages, date_range, concurrency))
+    
+    async def scan_file_async(self, path, pages=None, date_range=None, checkpoint_path=None, concurrency=None):
+        """API assíncrona: busca os termos de um arquivo (ou '-' para stdin) em streaming
+    
+        Gera (termo, [itens por página]) conforme cada termo termina. Com checkpoint_path, a
+        leitura recomeça do último offset salvo e um termo só conta como concluído depois
+        de consumido.
+        """
+        checkpoint = Checkpoint(checkpoint_path, path) if checkpoint_path else None
+        if checkpoint and checkpoint.offset:
+            print(f"⏩ Retomando do byte {checkpoint.offset} ({checkpoint.completed} termo(s) já concluídos)")
+    
+        def terms():
+            for index, (term, offset) in enumerate(iter_terms(path, checkpoint.offset if checkpoint else 0)):
+                if checkpoint:
+                    checkpoint.started(index, offset)
+                yield term
+    
+        results = self.engine(concurrency).stream(terms(), pages or self.config.pages, date_range)
+        try:
+            async for index, term, term_pages in results:
+                yield term, term_pages
+                if checkpoint:
+                    checkpoint.done(index)
+        finally:
+            await results.aclose()
+            if checkpoint:
+                checkpoint.save()
+    
+    async def records_async(self, terms, pages=None, date_range=None, concurrency=None):
+        """API assíncrona: gera um ResultRecord por item encontrado
+    
+        terms pode ser qualquer iterável (inclusive um gerador de arquivo). Os termos são
+        buscados sob demanda: enquanto o consumidor não pede o próximo registro, nenhum
+        termo novo começa.
+        """
+        results = self.engine(concurrency).stream(terms, pages or self.config.pages, date_range)
+        try:
+            async for _, term, term_pages in results:
+                data_type = detect_data_type(term)
+                for page, items in enumerate(term_pages, 1):
+                    for record in records_from_page(term, data_type, page, items):
+                        yield record
+        finally:
+            await results.aclose()
+    
+    def iter_records(self, terms, pages=None, date_range=None, concurrency=None):
+        """Gerador síncrono de records_async: cada next() busca só o necessário"""
+        loop = asyncio.new_event_loop()
+        records = self.records_async(terms, pages, date_range, concurrency)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(records.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(records.aclose())
+            loop.close()
+    
+    def run(self):
+        """Executa o scan configurado imprimindo os resultados (o que o main() faz com o .env)"""
+        config = self.config
+        if not config.token:
+            print("❌ ERRO: Token do GitHub não configurado!")
+            return 1
+    
+        date_range = config.date_range()
+        if date_range and date_range.startswith('pushed:'):
+            print(f"📅 Filtro de data: repositórios com push entre {config.start_date} e {config.end_date}")
+        elif date_range:
+            print(f"📅 Filtro de data: repositórios criados entre {config.start_date} e {config.end_date}")
+        else:
+            print("📅 Sem filtro de data - buscando em todo o histórico")
+    
+        if config.search_terms_file:
+            source = 'stdin' if config.search_terms_file == '-' else config.search_terms_file
+            print(f"📄 Lendo termos em streaming de: {source}")
+            print(f"⚡ Concorrência: {config.concurrency} requisição(ões) simultânea(s) com {len(self.token_pool)} token(s)")
+            results = self.scan_file_async(config.search_terms_file, config.pages, date_range,
+                                           config.terms_checkpoint or None)
+        else:
+            print(f"🔍 Buscando por: {', '.join(config.search_terms)}")
+    
+            if not config.search_terms:
+                print("❌ Erro: Nenhum termo de busca configurado")
+                print("Configure a variável SEARCH_TERM (ou SEARCH_TERMS_FILE) no arquivo .env")
+                return 1
+    
+            print(f"⚡ Concorrência: {config.concurrency} requisição(ões) simultânea(s) com {len(self.token_pool)} token(s)")
+            results = self.scan_iter(config.search_terms, config.pages, date_range)
+    
+        sink = NDJSONSink(config.results_ndjson) if config.results_ndjson else None
+        try:
+            asyncio.run(print_scan(results, sink))
+        except TokensRevoked as e:
+            print(f"❌ ERRO: {e}")
+            return 1
+        finally:
+            if sink:
+                sink.close()
+                print(f"🧾 {sink.written} registro(s) gravados em {config.results_ndjson}")
+    
+        if self.request_stats is not None:
+            self.request_stats.print_summary()
+        if self.http_cache:
+            self.http_cache.print_summary()
+        if self.result_cache:
+            self.result_cache.print_summary()
+        if self.strategy_stats:
+            print("📊 Rendimento das estratégias: python strategy_stats.py")
+        return 0
 
-def main():
-    if not reload_env_config():
-        print("❌ Erro: Token não configurado após recarregar .env")
-        exit(1)
+class AsyncSearchEngine:
+    """Executa termos, páginas e estratégias em paralelo com limite de concorrência"""
+    
+    def __init__(self, concurrency=None, strategy_fanout=None, scanner=None):
+        self.scanner = scanner or default_scanner()
+        config = self.scanner.config
+        self.concurrency = max(1, concurrency or config.concurrency)
+        self.strategy_fanout = max(1, strategy_fanout or config.strategy_fanout)
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        self._semaphore = None
+        self._shared = {}
+        self.plan = None
+        # Chamado no loop como on_page(cursor, página, itens) a cada página recebida
+        self.on_page = None
+    
+    def close(self):
+        """Libera o pool de threads do motor"""
+        self._executor.shutdown(wait=False)
     
-    date_range = None
-    if START_DATE and END_DATE:
-        if START_DATE >= '2008-01-01':
-            date_range = f'pushed:{START_DATE}..{END_DATE}'
-            print(f"📅 Filtro de data: repositórios com push entre {START_DATE} e {END_DATE}")
+    async def _run(self, func, *args):
+        """Executa uma chamada bloqueante no pool respeitando o limite de concorrência"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+    
+    async def prepare_queries(self, term, date_range=None):
+        """Gera as queries do termo e aplica o filtro de data uma única vez"""
+        if date_range and (term, date_range) not in self.scanner.date_filter_cache:
+            return await self._run(self.scanner.strategy_queries, term, date_range)
+        return self.scanner.strategy_queries(term, date_range)
+    
+    async def search_page(self, queries, page):
+        """Busca uma página tentando as estratégias em ondas de STRATEGY_FANOUT queries"""
+        for start in range(0, len(queries), self.strategy_fanout):
+            wave = queries[start:start + self.strategy_fanout]
+            responses = await asyncio.gather(*(self._run(self.scanner.fetch_query_page, q, page) for q in wave))
+            for status, items in responses:
+                if items:  # Mantém a ordem de prioridade das estratégias
+                    return items
+            if any(status == 403 for status, _ in responses):
+                return []
+        return []
+    
+    async def search(self, term, page, date_range=None):
+        """Equivalente assíncrono de search_github"""
+        queries = await self.prepare_queries(term, date_range)
+        return await self.search_page(queries, page)
+    
+    async def start_cursor(self, cursor):
+        """Primeira página do cursor: estratégias em ondas, fixando a primeira com resultados"""
+        queries = cursor.queries
+        for start in range(0, len(queries), self.strategy_fanout):
+            wave = queries[start:start + self.strategy_fanout]
+            responses = await asyncio.gather(*(self.fetch_page(q, 1, cursor.per_page) for q in wave))
+            for offset, (status, items, total_count, next_url) in enumerate(responses):
+                if items:  # Mantém a ordem de prioridade das estratégias
+                    return cursor.start(start + offset, items, total_count, next_url)
+            if any(response[0] == 403 for response in responses):
+                break
+        cursor.finish()
+        return []
+    
+    async def fetch_page(self, query, page, per_page, url=None):
+        """fetch_search_page no pool, enviando cada (query canônica, página) uma única vez
+    
+        Termos que geram a mesma query aguardam a mesma requisição e recebem o mesmo resultado.
+        """
+        key = (canonical_query(query), page, per_page)
+        if key not in self._shared:
+            self._shared[key] = asyncio.ensure_future(
+                self._run(self.scanner.fetch_search_page, query, page, url, per_page)
+            )
+        return await self._shared[key]
+    
+    async def follow_cursor(self, cursor, items):
+        """Segue as páginas seguintes do cursor a partir dos itens da primeira"""
+        results = []
+        while items:
+            results.append(items)
+            if self.on_page:
+                self.on_page(cursor, len(results), items)
+            if cursor.exhausted:
+                break
+            status, items, total_count, next_url = await self.fetch_page(
+                cursor.query, cursor.page + 1, cursor.per_page, cursor.next_url
+            )
+            if not items:
+                cursor.finish()
+                break
+            items = cursor.advance(items, total_count, next_url)
+        return results
+    
+    async def scan_term(self, term, pages, date_range=None, queries=None):
+        """Busca as páginas de um termo seguindo o cursor e o plano de paginação"""
+        config = self.scanner.config
+        if queries is None and self.plan and term in self.plan.term_queries:
+            queries = self.plan.queries_for(term)
+        elif queries is None:
+            queries = await self.prepare_queries(term, date_range)
+        if config.partition_large_results:
+            # Enumeração completa: até 1000 resultados pelo cursor, além disso por fatias
+            plan = PagePlan(SEARCH_RESULT_CAP // MAX_PER_PAGE, MAX_PER_PAGE)
         else:
-            date_range = f'created:{START_DATE}..{END_DATE}'
-            print(f"📅 Filtro de data: repositórios criados entre {START_DATE} e {END_DATE}")
-    else:
-        print("📅 Sem filtro de data - buscando em todo o histórico")
+            plan = self.scanner.create_plan(pages)
+        cursor = PaginationCursor(term, queries, plan)
+        items = await self.start_cursor(cursor)
+    
+        if (config.partition_large_results and items and cursor.total_count > SEARCH_RESULT_CAP
+                and QueryPartitioner.can_partition(cursor.query)):
+            partitioner = QueryPartitioner(self.fetch_page, config.partition_max_requests)
+            merged = await partitioner.enumerate(cursor.query, cursor.total_count)
+            return [merged[i:i + MAX_PER_PAGE] for i in range(0, len(merged), MAX_PER_PAGE)]
+    
+        return await self.follow_cursor(cursor, items)
+    
+    def build_plan(self, terms, date_range=None):
+        """Planeja as queries de todos os termos de uma vez, sem duplicatas"""
+        self.plan = QueryPlan.build(terms, lambda term: self.scanner.strategy_queries(term, date_range))
+        self.plan.print_summary()
+        return self.plan
+    
+    async def probe_date_filters(self, terms, date_range):
+        """Testa o filtro de data de todos os termos em um único lote concorrente"""
+        cache = self.scanner.date_filter_cache
+        pending = [t for t in dict.fromkeys(terms) if (t, date_range) not in cache]
+        if pending:
+            print(f"🗒️ Testando filtro de data para {len(pending)} termo(s) em lote...")
+            await asyncio.gather(*(self._run(self.scanner.probe_date_filter, term, date_range) for term in pending))
+    
+    async def screen_batches(self, terms, pages, date_range=None):
+        """Busca os termos em grupos com OR e resolve os grupos que cabem em uma requisição
+    
+        Grupos sem resultados descartam todos os seus termos. Sem filtro de data, um grupo
+        cujo total cabe em uma página tem os itens atribuídos aos termos pelos fragmentos,
+        desde que todo item tenha sido atribuído a algum termo.
+        """
+        unique = list(dict.fromkeys(terms))
+        batchable = [t for t, data_type in zip(unique, classify_many(unique)) if is_batchable(t, data_type)]
+        batches = [batch for batch in batch_terms(batchable) if len(batch) > 1]
+        if not batches:
+            return {}
     
-    print(f"🔍 Buscando por: {', '.join(SEARCH_TERMS)}")
+        responses = await asyncio.gather(*(self._run(self.scanner.fetch_term_batch, batch) for batch in batches))
+        wanted = self.scanner.create_plan(pages).wanted
+        resolved = {}
+        for batch, (status, items, total_count) in zip(batches, responses):
+            if status != 200:
+                continue
+            if total_count == 0:
+                resolved.update({term: [] for term in batch})
+            elif total_count <= len(items) and not date_range:
+                assigned = assign_items(batch, items)
+                # Um item sem fragmento de nenhum termo pode ser de qualquer um deles:
+                # o grupo volta para a busca normal em vez de perder o resultado
+                if len({id(item) for matched in assigned.values() for item in matched}) < len(items):
+                    continue
+                for term, matched in assigned.items():
+                    resolved[term] = [matched[:wanted]] if matched else []
     
-    if not SEARCH_TERMS:
-        print("❌ Erro: Nenhum termo de busca configurado no arquivo .env")
-        print("Configure a variável SEARCH_TERM no arquivo .env")
+        print(f"📦 {len(batches)} grupo(s) com OR resolveram {len(resolved)} de {len(batchable)} termo(s) agrupáveis")
+        return resolved
+    
+    async def scan_iter(self, terms, pages, date_range=None):
+        """Busca todos os termos em paralelo, gerando (termo, [itens por página]) conforme cada um termina"""
+        tasks = []
+        try:
+            batching = self.scanner.config.batch_terms
+            resolved = await self.screen_batches(terms, pages, date_range) if batching else {}
+            for term, term_pages in resolved.items():
+                yield term, term_pages
+            pending = [term for term in dict.fromkeys(terms) if term not in resolved]
+            if date_range:
+                await self.probe_date_filters(pending, date_range)
+            self.build_plan(pending, date_range)
+            tasks = [asyncio.ensure_future(self.scan_named(term, pages, date_range)) for term in pending]
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.close()
+    
+    async def scan_named(self, term, pages, date_range=None):
+        return term, await self.scan_term(term, pages, date_range)
+    
+    async def scan(self, terms, pages, date_range=None):
+        """Busca todos os termos em paralelo e devolve {termo: [itens por página]}"""
+        results = {}
+        async for term, term_pages in self.scan_iter(terms, pages, date_range):
+            results[term] = term_pages
+        return {term: results[term] for term in dict.fromkeys(terms) if term in results}
+    
+    async def stream(self, terms, pages, date_range=None, window=None):
+        """Busca termos de um iterável sob demanda, gerando (índice, termo, páginas) ao concluir cada um
+    
+        No máximo window termos ficam em andamento: o próximo só é lido quando um termo
+        termina e é consumido, então a memória não depende do tamanho da lista.
+        """
+        window = window or 4 * self.concurrency
+        source = enumerate(terms)
+        pending = set()
+        try:
+            while True:
+                for index, term in source:
+                    pending.add(asyncio.ensure_future(self.stream_term(index, term, pages, date_range)))
+                    if len(pending) >= window:
+                        break
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            self.close()
+    
+    async def stream_term(self, index, term, pages, date_range=None):
+        """Busca um termo do stream e descarta o estado dele ao terminar"""
+        queries = []
+        try:
+            queries = await self.prepare_queries(term, date_range)
+            return index, term, await self.scan_term(term, pages, date_range, queries)
+        finally:
+            self.forget(term, date_range, queries)
+    
+    def forget(self, term, date_range=None, queries=()):
+        """Libera o estado de um termo concluído (filtro de data, estratégias, páginas compartilhadas)"""
+        self.scanner.date_filter_cache.pop((term, date_range), None)
+        for query in queries:
+            self.scanner.strategy_keys.pop(query, None)
+        finished = [key for key, future in self._shared.items() if future.done()]
+        for key in finished:
+            del self._shared[key]
+
+def search_github(term, page, date_range=None):
+    """Busca no GitHub com estratégias inteligentes baseadas no tipo de dado"""
+    return default_scanner().search_github(term, page, date_range)
+
+async def search_github_async(term, page, date_range=None, concurrency=None):
+    """API assíncrona: busca uma página de um termo"""
+    return await default_scanner().search_async(term, page, date_range, concurrency)
+
+async def scan_async(terms, pages, date_range=None, concurrency=None):
+    """API assíncrona: busca várias páginas de vários termos em paralelo"""
+    return await default_scanner().scan_async(terms, pages, date_range, concurrency)
+
+def scan(terms, pages, date_range=None, concurrency=None):
+    """Wrapper síncrono de scan_async"""
+    return asyncio.run(scan_async(terms, pages, date_range, concurrency))
+
+def scan_file_async(path, pages, date_range=None, checkpoint_path=None, concurrency=None):
+    """Scanner.scan_file_async do scanner configurado pelo .env"""
+    return default_scanner().scan_file_async(path, pages, date_range, checkpoint_path, concurrency)
+
+def records_async(terms, pages, date_range=None, concurrency=None):
+    """Scanner.records_async do scanner configurado pelo .env"""
+    return default_scanner().records_async(terms, pages, date_range, concurrency)
+
+def iter_records(terms, pages, date_range=None, concurrency=None):
+    """Scanner.iter_records do scanner configurado pelo .env"""
+    return default_scanner().iter_records(terms, pages, date_range, concurrency)
+
+def write_term_records(sink, term, pages):
+    """Envia ao sink os registros de um termo concluído"""
+    data_type = detect_data_type(term)
+    for page, items in enumerate(pages, 1):
+        sink.write_all(records_from_page(term, data_type, page, items))
+
+def print_term_results(term, pages):
+    """Imprime as páginas de resultados de um termo"""
+    print(f"\n=== Termo: {term} ===")
+    for page, results in enumerate(pages, 1):
+        print(f"\nPágina {page}")
+        for item in results:
+            repo = item['repository']['full_name']
+            file_path = item['path']
+            html_url = item['html_url']
+            print(f"📁 {repo} - {file_path}\n🔗 {html_url}\n")
+    if not pages:
+        print("Sem resultados.")
+    else:
+        print(f"📊 {sum(len(p) for p in pages)} resultado(s) em {len(pages)} requisição(ões) de página")
+
+async def print_scan(results, sink=None):
+    """Imprime (e envia ao sink) os resultados de cada termo conforme ele termina"""
+    async for term, term_pages in results:
+        print_term_results(term, term_pages)
+        if sink:
+            write_term_records(sink, term, term_pages)
+
+def main():
+    if not reload_env_config():
+        print("❌ ERRO: Token do GitHub não configurado!")
+        print("Configure seu token no arquivo .env")
+        print("Obtenha um token em: https://github.com/settings/tokens")
         exit(1)
-    for term in SEARCH_TERMS:
-        print(f"\n=== Termo: {term} ===")
-        for page in range(1, PAGES + 1):
-            print(f"\nPágina {page}")
-            results = search_github(term, page, date_range)
-            if not results:
-                print("Sem resultados ou fim das páginas.")
-                break
-            for item in results:
-                repo = item['repository']['full_name']
-                file_path = item['path']
-                html_url = item['html_url']
-                print(f"📁 {repo} - {file_path}\n🔗 {html_url}\n")
-            time.sleep(SLEEP_TIME)
+
+    status = default_scanner().run()
+    if status:
+        exit(status)
 
 if __name__ == "__main__":
     main()
-
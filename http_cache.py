@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Cache HTTP em disco com requisições condicionais (ETag / Last-Modified)
+
+Cada URL de busca vira um arquivo JSON com os validadores e o corpo já
+decodificado. Em execuções seguintes o scanner envia If-None-Match /
+If-Modified-Since e, quando o GitHub responde 304, o corpo vem do cache
+sem novo parse do JSON da resposta.
+
+O diretório é limitado por idade e por número de arquivos (os usados há mais
+tempo saem primeiro) e só as entradas mais recentes ficam também em memória,
+então o uso de disco e de memória não cresce com o tamanho da lista de termos.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+# Entradas mantidas em memória (a entrada lida para os headers condicionais é
+# usada logo depois, quando chega o 304)
+MEMORY_ENTRIES = 64
+
+# Gravações entre duas limpezas do diretório
+PRUNE_EVERY = 200
+
+class CachedResponse:
+    """Resposta servida do cache com a mesma interface usada pelo scanner"""
+
+    from_cache = True
+
+    def __init__(self, entry, headers=None):
+        self.status_code = 200
+        self.url = entry['url']
+        self.headers = headers if headers is not None else {}
+        self._data = entry['data']
+
+    def json(self):
+        return self._data
+
+    @property
+    def text(self):
+        return json.dumps(self._data, ensure_ascii=False)
+
+class HTTPCache:
+    """Armazena ETag, Last-Modified e corpo de cada URL em um diretório"""
+
+    def __init__(self, directory='.cache/http', max_entries=5000, max_age=604800):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.pruned = 0
+        self._memory = OrderedDict()
+        self._stores = 0
+        self._lock = threading.Lock()
+        self.prune()
+
+    def _path(self, url):
+        return self.directory / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _remember(self, url, entry):
+        """Guarda a entrada na memória, descartando a menos recente; requer o lock"""
+        self._memory[url] = entry
+        self._memory.move_to_end(url)
+        while len(self._memory) > MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    def get(self, url):
+        """Entrada em cache da URL ou None"""
+        with self._lock:
+            if url in self._memory:
+                self._memory.move_to_end(url)
+                return self._memory[url]
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('url') != url:
+            return None
+        with self._lock:
+            self._remember(url, entry)
+        return entry
+
+    def conditional_headers(self, url):
+        """Headers If-None-Match / If-Modified-Since para a URL, se houver cache"""
+        entry = self.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, response):
+        """Guarda uma resposta 200 que tenha validadores"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'data': response.json(),
+        }
+        path = self._path(url)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._remember(url, entry)
+            self._stores += 1
+            prune = self._stores % PRUNE_EVERY == 0
+        if prune:
+            self.prune()
+
+    def prune(self):
+        """Remove arquivos mais velhos que max_age e os usados há mais tempo acima de max_entries"""
+        cutoff = time.time() - self.max_age if self.max_age else None
+        files = []
+        for item in os.scandir(self.directory):
+            if not item.name.endswith('.json'):
+                continue
+            try:
+                mtime = item.stat().st_mtime
+            except OSError:
+                continue
+            if cutoff is not None and mtime < cutoff:
+                self._remove(item.path)
+            else:
+                files.append((mtime, item.path))
+        if self.max_entries and len(files) > self.max_entries:
+            files.sort()
+            for _, path in files[:len(files) - self.max_entries]:
+                self._remove(path)
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            self.pruned += 1
+        except OSError:
+            pass
+
+    def resolve(self, url, response):
+        """Converte um 304 na resposta em cache e registra respostas 200 novas"""
+        if response.status_code == 304:
+            entry = self.get(url)
+            if entry:
+                self.hits += 1
+                try:
+                    os.utime(self._path(url))  # Conta como uso recente na limpeza
+                except OSError:
+                    pass
+                return CachedResponse(entry, response.headers)
+            return response
+        if response.status_code == 200:
+            self.misses += 1
+            self.store(url, response)
+        return response
+
+    def print_summary(self):
+        total = self.hits + self.misses
+        if total:
+            print(f"💾 Cache HTTP: {self.hits} página(s) não modificada(s) (304) de {total}")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Estado de paginação por termo: a estratégia vencedora na página 1 é mantida
+nas páginas seguintes, que seguem o header Link (rel="next") do GitHub
+"""
+
+import math
+import re
+
+# A API de busca nunca devolve além dos 1000 primeiros resultados
+SEARCH_RESULT_CAP = 1000
+
+# Maior per_page aceito pela API de busca
+MAX_PER_PAGE = 100
+
+_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="([^"]+)"')
+
+def parse_link_header(value):
+    """Converte um header Link em {rel: url}"""
+    if not value:
+        return {}
+    return {rel: url for url, rel in _LINK_RE.findall(value)}
+
+class PagePlan:
+    """Quantas páginas e de que tamanho buscar para um termo
+
+    O alvo é PAGES x RESULTS_PER_PAGE resultados (limitado a 1000). No modo
+    adaptativo o per_page sobe até 100 para cobrir o alvo com o menor número
+    de requisições; depois do primeiro total_count o número de páginas é
+    recalculado para nunca pedir uma página vazia no final.
+    """
+
+    def __init__(self, pages, per_page, adaptive=True):
+        self.wanted = min(pages * per_page, SEARCH_RESULT_CAP)
+        if adaptive and self.wanted > 0:
+            self.max_requests = math.ceil(self.wanted / MAX_PER_PAGE)
+            self.per_page = math.ceil(self.wanted / self.max_requests)
+        else:
+            self.per_page = per_page
+            self.max_requests = math.ceil(self.wanted / per_page) if per_page else 0
+
+    def pages_for(self, total_count):
+        """Número exato de páginas a buscar dado o total_count da primeira resposta"""
+        available = min(total_count, self.wanted)
+        return min(self.max_requests, math.ceil(available / self.per_page))
+
+class PaginationCursor:
+    """Lembra a query vencedora de um termo, seu total_count e a URL da próxima página"""
+
+    def __init__(self, term, queries, plan):
+        self.term = term
+        self.queries = queries
+        self.plan = plan
+        self.per_page = plan.per_page
+        self.max_pages = plan.max_requests
+        self.fetched = 0
+        self.strategy_index = None
+        self.query = None
+        self.total_count = None
+        self.next_url = None
+        self.page = 0
+        self.exhausted = False
+
+    @property
+    def started(self):
+        return self.query is not None
+
+    def start(self, strategy_index, items, total_count, next_url):
+        """Fixa a estratégia que trouxe resultados na primeira página"""
+        self.strategy_index = strategy_index
+        self.query = self.queries[strategy_index]
+        self.max_pages = self.plan.pages_for(total_count)
+        return self.advance(items, total_count, next_url)
+
+    def advance(self, items, total_count, next_url):
+        """Registra uma página recebida e devolve seus itens dentro do alvo do plano"""
+        self.page += 1
+        self.total_count = total_count
+        self.next_url = next_url
+        items = items[:max(self.plan.wanted - self.fetched, 0)]
+        self.fetched += len(items)
+        if not next_url or self.page >= self.max_pages or self.fetched >= self.plan.wanted:
+            self.exhausted = True
+        return items
+
+    def finish(self):
+        self.next_url = None
+        self.exhausted = True
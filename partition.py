@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Particionamento do espaço de resultados para passar do limite de 1000 da busca
+
+Uma query com total_count acima do limite é dividida recursivamente em faixas
+de size: até que cada fatia caiba no limite. Uma faixa de tamanho único que
+ainda passe do limite é dividida pelas extensões mais comuns; os arquivos de
+outras extensões dessa faixa não são alcançáveis (a query não comporta excluir
+todas as extensões da lista) e o particionamento é marcado como incompleto.
+As fatias são buscadas em paralelo e os itens combinados sem duplicatas.
+"""
+
+import asyncio
+import math
+import re
+
+from pagination import MAX_PER_PAGE, SEARCH_RESULT_CAP
+
+# Arquivos maiores que 384 KB não são indexados pela busca de código
+MAX_FILE_SIZE = 384 * 1024
+
+# Extensões usadas quando uma faixa de size: não pode mais ser dividida
+COMMON_EXTENSIONS = [
+    'env', 'json', 'yml', 'yaml', 'xml', 'properties', 'ini', 'conf', 'cfg', 'toml',
+    'py', 'js', 'ts', 'java', 'go', 'rb', 'php', 'cs', 'sh', 'txt', 'md', 'html', 'sql',
+]
+
+_SHARD_QUALIFIER_RE = re.compile(r'(^|\s)(size|extension):', re.IGNORECASE)
+
+def item_key(item):
+    """Identidade de um item de busca para deduplicação"""
+    return item.get('html_url') or (item.get('repository', {}).get('full_name'), item.get('path'), item.get('sha'))
+
+def merge_unique(*item_lists):
+    """Concatena listas de itens mantendo a ordem e descartando repetidos"""
+    seen = set()
+    merged = []
+    for items in item_lists:
+        for item in items:
+            key = item_key(item)
+            if key not in seen:
+                seen.add(key)
+                merged.append(item)
+    return merged
+
+class RequestBudget:
+    """Limite de requisições de um particionamento, para custo previsível"""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+
+    def take(self, count=1):
+        if self.used + count > self.limit:
+            return False
+        self.used += count
+        return True
+
+class QueryPartitioner:
+    """Enumera todos os resultados de uma query dividindo-a em fatias de até 1000"""
+
+    def __init__(self, fetch, max_requests=200, cap=SEARCH_RESULT_CAP):
+        # fetch(query, page, per_page) é uma corrotina que devolve (status, itens, total_count, próxima URL)
+        self.fetch = fetch
+        self.cap = cap
+        self.budget = RequestBudget(max_requests)
+        self.shards = 0
+        self.truncated = False
+        self.budget_exhausted = False
+        # Resultados estimados que a divisão por extensão não alcança
+        self.unreachable = 0
+
+    @staticmethod
+    def can_partition(query):
+        return not _SHARD_QUALIFIER_RE.search(query)
+
+    @staticmethod
+    def estimate_requests(total_count):
+        """Estimativa de custo: páginas de 100 mais uma sondagem por divisão de faixa"""
+        pages = math.ceil(total_count / MAX_PER_PAGE)
+        shards = math.ceil(total_count / SEARCH_RESULT_CAP)
+        return pages + 2 * shards
+
+    async def enumerate(self, query, total_count=None):
+        """Todos os itens da query (até o orçamento de requisições), sem duplicatas"""
+        if total_count is not None:
+            print(f"🧩 Particionando '{query}': {total_count} resultados, "
+                  f"~{self.estimate_requests(total_count)} requisições estimadas")
+        items = await self._size_range(query, 0, MAX_FILE_SIZE)
+        if self.budget_exhausted:
+            print(f"⚠️  Orçamento de {self.budget.limit} requisições atingido; particionamento incompleto")
+        if self.unreachable:
+            print(f"⚠️  ~{self.unreachable} resultado(s) de extensões fora da lista ou acima do limite "
+                  f"por extensão não foram enumerados; particionamento incompleto")
+        print(f"🧩 {self.shards} fatia(s), {self.budget.used} requisições, {len(items)} resultados únicos")
+        return items
+
+    async def _fetch_shard(self, shard_query):
+        """Busca a primeira página da fatia; devolve (itens, total_count) ou None se sem orçamento"""
+        if not self.budget.take():
+            self.truncated = self.budget_exhausted = True
+            return None
+        status, items, total_count, _ = await self.fetch(shard_query, 1, MAX_PER_PAGE)
+        if status != 200:
+            return [], 0
+        return items, total_count
+
+    async def _fetch_remaining(self, shard_query, first_items, total_count):
+        """Busca as demais páginas de uma fatia que cabe no limite"""
+        self.shards += 1
+        pages = math.ceil(min(total_count, self.cap) / MAX_PER_PAGE)
+        wanted = [p for p in range(2, pages + 1) if self.budget.take()]
+        if len(wanted) < pages - 1:
+            self.truncated = self.budget_exhausted = True
+        responses = await asyncio.gather(*(self.fetch(shard_query, p, MAX_PER_PAGE) for p in wanted))
+        return merge_unique(first_items, *(r[1] for r in responses))
+
+    async def _size_range(self, query, low, high):
+        shard_query = f'{query} size:{low}..{high}'
+        fetched = await self._fetch_shard(shard_query)
+        if fetched is None:
+            return []
+        items, total_count = fetched
+        if total_count <= self.cap:
+            return await self._fetch_remaining(shard_query, items, total_count)
+        if low < high:
+            middle = (low + high) // 2
+            left, right = await asyncio.gather(
+                self._size_range(query, low, middle),
+                self._size_range(query, middle + 1, high),
+            )
+            return merge_unique(left, right)
+        return await self._extensions(shard_query, total_count)
+
+    async def _extensions(self, shard_query, total_count):
+        """Última divisão: a faixa de size: única é separada por extension:
+
+        As extensões são disjuntas, então o que a soma dos totais delas não cobre
+        do total da faixa está em outras extensões e fica de fora.
+        """
+        covered = 0
+
+        async def by_extension(extension):
+            nonlocal covered
+            ext_query = f'{shard_query} extension:{extension}'
+            fetched = await self._fetch_shard(ext_query)
+            if fetched is None:
+                return []
+            items, ext_total = fetched
+            covered += ext_total
+            if ext_total > self.cap:
+                self.truncated = True
+                self.unreachable += ext_total - self.cap
+            return await self._fetch_remaining(ext_query, items, ext_total)
+
+        results = await asyncio.gather(*(by_extension(ext) for ext in COMMON_EXTENSIONS))
+        if not self.budget_exhausted and covered < total_count:
+            self.truncated = True
+            self.unreachable += total_count - covered
+        return merge_unique(*results)
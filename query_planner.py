@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Planejamento global das queries de todos os termos
+
+As queries de todos os termos são canonicalizadas e deduplicadas antes do
+scan: cada query única é enviada uma vez e seu resultado é entregue a todos
+os termos que a geraram.
+"""
+
+from query_validator import equivalence_key
+
+def canonical_query(query):
+    """Forma canônica usada para detectar queries equivalentes"""
+    return equivalence_key(query)
+
+class QueryPlan:
+    """Queries únicas de uma lista de termos e os termos que dependem de cada uma"""
+
+    def __init__(self):
+        self.term_queries = {}
+        self.queries = {}
+        self.owners = {}
+        self.generated = 0
+
+    @classmethod
+    def build(cls, terms, expand):
+        """Monta o plano; expand(term) devolve as queries do termo em ordem de prioridade"""
+        plan = cls()
+        for term in terms:
+            if term not in plan.term_queries:
+                plan.add(term, expand(term))
+        return plan
+
+    def add(self, term, queries):
+        ordered = []
+        for query in queries:
+            self.generated += 1
+            key = canonical_query(query)
+            if key in ordered:
+                continue  # Estratégia equivalente a uma anterior do mesmo termo
+            ordered.append(key)
+            self.queries.setdefault(key, query)
+            self.owners.setdefault(key, []).append(term)
+        self.term_queries[term] = ordered
+
+    def queries_for(self, term):
+        """Queries do termo (texto a enviar) já deduplicadas, em ordem de prioridade"""
+        return [self.queries[key] for key in self.term_queries.get(term, [])]
+
+    def shared_queries(self):
+        """Queries usadas por mais de um termo"""
+        return {self.queries[key]: terms for key, terms in self.owners.items() if len(terms) > 1}
+
+    def print_summary(self):
+        unique = len(self.queries)
+        print(f"🧭 Plano de queries: {self.generated} geradas, {unique} únicas "
+              f"({self.generated - unique} duplicadas eliminadas)")
+        for query, terms in list(self.shared_queries().items())[:5]:
+            print(f"   ↪ {query} compartilhada por {len(terms)} termos")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Validação local das queries antes de qualquer requisição
+
+- Pseudo-qualificadores (email:, token:, api_key:...) não existem na busca de
+  código; são reescritos como texto, que é como o índice os trata
+- Queries com aspas desbalanceadas, longas demais ou sem texto buscável são descartadas
+- Estratégias equivalentes a uma anterior do mesmo termo são descartadas: a busca
+  ignora maiúsculas e pontuação e combina as palavras soltas com AND
+- Queries que receberam 422, e estratégias (templates) que só recebem 422, entram
+  em uma denylist persistente
+"""
+
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+from strategy_stats import strategy_key
+
+# Tamanho máximo de uma query na busca do GitHub
+MAX_QUERY_LENGTH = 256
+
+# Qualificadores aceitos pela busca de código (e os de data usados pelo scanner)
+KNOWN_QUALIFIERS = {
+    'in', 'language', 'size', 'path', 'filename', 'extension', 'user', 'org', 'repo',
+    'fork', 'is', 'pushed', 'created',
+}
+
+# Operadores booleanos: com eles as palavras deixam de ser um AND simples
+OPERATORS = {'AND', 'OR', 'NOT'}
+
+# Símbolos que a busca de código ignora ao indexar e ao buscar
+_IGNORED_SYMBOLS_RE = re.compile(r'[.,:;/\\`\'"=*!?#$&+^|~<>(){}\[\]@\s]+')
+
+# "://" não é qualificador: https://... é uma palavra
+_ELEMENT_RE = re.compile(r'(-?)([A-Za-z_][\w-]*):(?!//)("[^"]*"|[^\s"]+)|"([^"]*)"|([^\s"]+)')
+_QUALIFIER_RE = re.compile(r'(^|\s)(-?)([A-Za-z_][\w-]*):(?!//)(?=["\w])')
+
+# Queries com 422 de uma estratégia, sem nenhum sucesso, para negar a estratégia inteira
+DENY_AFTER = 3
+
+def _tokens(text):
+    return [t for t in _IGNORED_SYMBOLS_RE.split(text.lower()) if t]
+
+def parse_query(query):
+    """Divide a query em [(tipo, chave, valor)] com tipo 'qualifier', 'phrase' ou 'word'"""
+    elements = []
+    for negation, key, value, phrase, word in _ELEMENT_RE.findall(query):
+        if key and key.lower() in KNOWN_QUALIFIERS:
+            elements.append(('qualifier', negation + key.lower(), value))
+        elif key:
+            # Pseudo-qualificador: o nome vira uma palavra e o valor continua como estava
+            elements.append(('word', None, negation + key))
+            if value.startswith('"'):
+                elements.append(('phrase', None, value[1:-1]))
+            else:
+                elements.append(('word', None, value))
+        elif word:
+            elements.append(('word', None, word))
+        else:
+            elements.append(('phrase', None, phrase))
+    return elements
+
+def rewrite_query(query):
+    """Query reescrita sem pseudo-qualificadores, pronta para enviar"""
+    def replace(match):
+        start, negation, key = match.groups()
+        if key.lower() in KNOWN_QUALIFIERS:
+            return match.group(0)
+        return f'{start}{negation}{key} '
+    return _QUALIFIER_RE.sub(replace, query)
+
+def invalid_reason(query):
+    """Motivo pelo qual a query seria rejeitada pela API, ou None se válida"""
+    if query.count('"') % 2:
+        return 'aspas desbalanceadas'
+    if len(query) > MAX_QUERY_LENGTH:
+        return f'mais de {MAX_QUERY_LENGTH} caracteres'
+    if not any(_tokens(value) for kind, _, value in parse_query(query) if kind != 'qualifier'):
+        return 'sem texto buscável'
+    return None
+
+def equivalence_key(query):
+    """Chave igual para queries que a busca trata como a mesma"""
+    elements = parse_query(query)
+    if any(kind == 'word' and value in OPERATORS for kind, _, value in elements):
+        return ' '.join(query.split())
+    words = set()
+    phrases = set()
+    qualifiers = set()
+    for kind, key, value in elements:
+        if kind == 'qualifier':
+            qualifiers.add(f'{key}:{value.lower()}')
+            continue
+        tokens = _tokens(value)
+        if kind == 'word' or len(tokens) == 1:
+            words.update(tokens)  # Palavras soltas são combinadas com AND, em qualquer ordem
+        elif tokens:
+            phrases.add('"' + ' '.join(tokens) + '"')
+    return ' '.join(sorted(words) + sorted(phrases) + sorted(qualifiers))
+
+class QueryDenylist:
+    """Queries e formatos de query que a API rejeitou com 422, persistidos em SQLite"""
+
+    def __init__(self, path='.cache/query_denylist.sqlite3'):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS invalid_queries (query TEXT PRIMARY KEY)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS strategy_shapes (
+                strategy TEXT PRIMARY KEY,
+                invalid INTEGER NOT NULL DEFAULT 0,
+                valid INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self._conn.commit()
+        self.queries = {row[0] for row in self._conn.execute("SELECT query FROM invalid_queries")}
+        self.strategies = {row[0]: [row[1], row[2]] for row in
+                           self._conn.execute("SELECT strategy, invalid, valid FROM strategy_shapes")}
+
+    def denies(self, query, strategy=None):
+        """True se a query já recebeu 422 ou sua estratégia (template do termo) só recebe 422"""
+        if equivalence_key(query) in self.queries:
+            return True
+        invalid, valid = self.strategies.get(strategy, (0, 0))
+        return invalid >= DENY_AFTER and valid == 0
+
+    def record(self, query, status, strategy=None):
+        """Registra a resposta de uma query enviada; só 200 e 422 dizem algo sobre a sintaxe"""
+        if status not in (200, 422):
+            return
+        key = equivalence_key(query)
+        with self._lock:
+            counts = self.strategies.setdefault(strategy, [0, 0]) if strategy else [0, 1]
+            if status == 422:
+                if key in self.queries:
+                    return
+                self.queries.add(key)
+                counts[0] += 1
+                self._conn.execute("INSERT OR IGNORE INTO invalid_queries VALUES (?)", (key,))
+            elif counts[1]:
+                return  # Um sucesso basta para a estratégia nunca ser negada
+            else:
+                counts[1] = 1
+            if strategy:
+                self._conn.execute("INSERT OR REPLACE INTO strategy_shapes VALUES (?, ?, ?)",
+                                   (strategy, counts[0], counts[1]))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def prune_queries(term, queries, denylist=None):
+    """Reescreve as queries do termo e descarta as inválidas, negadas ou equivalentes a uma anterior
+
+    Devolve (queries a enviar, [(query descartada, motivo)]).
+    """
+    kept = []
+    dropped = []
+    seen = set()
+    for query in queries:
+        rewritten = rewrite_query(query)
+        reason = invalid_reason(query) or invalid_reason(rewritten)
+        if reason is None and denylist and denylist.denies(rewritten, strategy_key(term, rewritten)):
+            reason = '422 conhecido'
+        if reason is None:
+            key = equivalence_key(rewritten)
+            if key in seen:
+                reason = 'equivalente a uma estratégia anterior'
+            seen.add(key)
+        if reason:
+            dropped.append((query, reason))
+        else:
+            kept.append(rewritten)
+    return kept, dropped
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Agendador de requisições guiado pelos headers de rate limit do GitHub
+"""
+
+import threading
+import time
+
+# Folga aplicada sobre o X-RateLimit-Reset para absorver diferença de relógio
+RESET_MARGIN = 1.0
+
+# Quota padrão da API de busca autenticada (requisições por minuto)
+SEARCH_LIMIT = 30
+
+class RateLimitScheduler:
+    """Gasta a quota de busca o mais rápido possível e espera exatamente até o reset"""
+
+    def __init__(self, fallback_wait=2, max_retries=5):
+        self.fallback_wait = fallback_wait
+        self.max_retries = max_retries
+        self.remaining = None
+        self.limit = None
+        self.reset_at = 0.0
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def wait_time(self):
+        """Segundos que a próxima requisição precisa aguardar (0 = pode enviar)"""
+        now = time.time()
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        if self.remaining is not None and self.remaining <= 0:
+            if self.reset_at > now:
+                return self.reset_at - now
+            self.remaining = None  # Janela nova: a próxima resposta informa a quota
+        return 0.0
+
+    def try_acquire(self):
+        """Reserva uma requisição se houver quota; senão devolve os segundos de espera"""
+        with self._lock:
+            wait = self.wait_time()
+            if wait <= 0 and self.remaining is not None:
+                self.remaining -= 1
+            return wait
+
+    def headroom(self):
+        """Quota ainda disponível na janela atual (o limite inteiro se desconhecida)"""
+        if self.remaining is None:
+            return self.limit if self.limit is not None else SEARCH_LIMIT
+        return self.remaining
+
+    def acquire(self):
+        """Bloqueia até haver quota disponível e reserva uma requisição"""
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            print(f"⏳ Quota de busca esgotada. Aguardando {wait:.1f}s até o reset...")
+            time.sleep(wait)
+
+    def update(self, response):
+        """Atualiza o estado com os headers da resposta; retorna True se ela deve ser repetida"""
+        headers = response.headers
+        remaining = _int_header(headers, 'X-RateLimit-Remaining')
+        reset = _int_header(headers, 'X-RateLimit-Reset')
+        limit = _int_header(headers, 'X-RateLimit-Limit')
+        retry_after = _int_header(headers, 'Retry-After')
+
+        with self._lock:
+            if response.status_code == 304 and self.remaining is not None:
+                self.remaining += 1  # Requisição condicional respondida com 304 não consome quota
+            if limit is not None:
+                self.limit = limit
+            stale = False
+            if reset is not None and remaining is not None:
+                reset += RESET_MARGIN
+                if reset > self.reset_at:  # Nova janela de quota
+                    self.reset_at = reset
+                    self.remaining = remaining
+                elif reset < self.reset_at:
+                    # Resposta atrasada de uma janela anterior: não diz nada da quota atual
+                    stale = True
+                elif self.remaining is None:
+                    self.remaining = remaining
+                else:
+                    # Respostas chegam fora de ordem: vale a menor quota vista na janela
+                    self.remaining = min(self.remaining, remaining)
+
+            if response.status_code not in (403, 429):
+                return False
+
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, time.time() + retry_after)
+            elif remaining == 0 and reset is not None:
+                if not stale:
+                    self.remaining = 0
+            elif response.status_code == 429 or 'rate limit' in response.text.lower():
+                # Limite secundário sem headers: recua pelo intervalo configurado
+                self.blocked_until = max(self.blocked_until, time.time() + self.fallback_wait)
+            else:
+                return False  # 403 de permissão, não de rate limit
+            return True
+
+    def request(self, send):
+        """Executa send() sob o controle do agendador, repetindo respostas limitadas"""
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            response = send()
+            if not self.update(response) or attempt == self.max_retries:
+                return response
+            print(f"⚠️  Rate limit atingido. Reenviando após o reset ({attempt + 1}/{self.max_retries})...")
+
+def _int_header(headers, name):
+    """Lê um header numérico, devolvendo None se ausente ou inválido"""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Cache persistente (SQLite) dos resultados de busca por (escopo, query, página, per_page)
+
+O escopo identifica o conjunto de tokens (hash, nunca o token): a busca de
+código vê repositórios privados do token, então um scan só reaproveita
+resultados obtidos com os mesmos tokens.
+
+- TTL por entrada, com TTLs menores para resultados vazios e queries inválidas (422)
+- Despejo LRU quando o número de entradas passa do limite configurado
+- Estatísticas de hits, misses, expirados e despejos
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+_TOKEN_RE = re.compile(r'"[^"]*"|\S+')
+
+def normalize_query(query):
+    """Forma canônica da query: espaços colapsados, minúsculas e qualificadores ordenados"""
+    tokens = [t.lower() for t in _TOKEN_RE.findall(query.strip())]
+    terms = [t for t in tokens if t.startswith('"') or ':' not in t]
+    qualifiers = sorted(t for t in tokens if not t.startswith('"') and ':' in t)
+    return ' '.join(terms + qualifiers)
+
+def token_scope(tokens):
+    """Identidade (sha256) do conjunto de tokens, usada como escopo do cache"""
+    digest = hashlib.sha256('\n'.join(sorted(set(tokens))).encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+class ResultCache:
+    """Resultados de busca com TTL, LRU e cache negativo"""
+
+    def __init__(self, path='.cache/results.sqlite3', ttl=21600, empty_ttl=3600,
+                 invalid_ttl=3600, max_entries=2000, scope=''):
+        self.scope = scope
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.empty_ttl = empty_ttl
+        self.invalid_ttl = invalid_ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(results)")]
+        if columns and 'scope' not in columns:
+            # Entradas de versões sem escopo: não se sabe com qual token vieram
+            self._conn.execute("DROP TABLE results")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                scope TEXT NOT NULL,
+                query TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                per_page INTEGER NOT NULL,
+                status INTEGER NOT NULL,
+                total_count INTEGER NOT NULL,
+                items TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (scope, query, page, per_page)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_access ON results (last_access)")
+        self._conn.commit()
+
+    def get(self, query, page, per_page):
+        """(status, itens, total_count) em cache ou None"""
+        key = (self.scope, normalize_query(query), page, per_page)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, total_count, items, expires_at FROM results "
+                "WHERE scope = ? AND query = ? AND page = ? AND per_page = ?", key
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            status, total_count, items, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM results WHERE scope = ? AND query = ? AND page = ? AND per_page = ?", key)
+                self._conn.commit()
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE results SET last_access = ? WHERE scope = ? AND query = ? AND page = ? AND per_page = ?",
+                (now,) + key
+            )
+            self._conn.commit()
+            if status != 200 or items == '[]':
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+        return status, json.loads(items), total_count
+
+    def put(self, query, page, per_page, status, items, total_count=0):
+        """Grava o resultado com o TTL adequado ao tipo (positivo, vazio ou inválido)"""
+        if status == 200:
+            ttl = self.ttl if items else self.empty_ttl
+        elif status == 422:
+            ttl = self.invalid_ttl
+        else:
+            return  # Erros transitórios (403, 5xx) não são cacheados
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.scope, normalize_query(query), page, per_page, status, total_count,
+                 json.dumps(items, ensure_ascii=False), now + ttl, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Remove expirados e, se preciso, as entradas menos usadas recentemente"""
+        self._conn.execute("DELETE FROM results WHERE expires_at <= ?", (time.time(),))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM results WHERE rowid IN "
+                "(SELECT rowid FROM results ORDER BY last_access ASC LIMIT ?)", (excess,)
+            )
+            self.evictions += excess
+
+    def stats(self):
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            'hits': self.hits,
+            'negative_hits': self.negative_hits,
+            'misses': self.misses,
+            'expired': self.expired,
+            'evictions': self.evictions,
+            'hit_rate': (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+        }
+
+    def print_summary(self):
+        stats = self.stats()
+        if stats['hits'] + stats['negative_hits'] + stats['misses']:
+            print(f"🗃️  Cache de resultados: {stats['hits']} hits, {stats['negative_hits']} hits negativos, "
+                  f"{stats['misses']} misses ({stats['hit_rate']:.0%}), {stats['evictions']} despejos")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
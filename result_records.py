@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Registros estruturados de resultado e o sink NDJSON
+
+Cada item encontrado vira um ResultRecord (termo, tipo, página, repositório,
+arquivo, URL, sha). O NDJSONSink grava um registro por linha assim que ele
+chega, então quem lê o arquivo ou pipe processa em paralelo com o scan.
+"""
+
+import json
+import sys
+from collections import namedtuple
+
+ResultRecord = namedtuple('ResultRecord', 'term data_type page repository path url sha')
+
+def records_from_page(term, data_type, page, items):
+    """Registros dos itens de uma página de resultados"""
+    return [
+        ResultRecord(
+            term=term,
+            data_type=data_type,
+            page=page,
+            repository=item.get('repository', {}).get('full_name'),
+            path=item.get('path'),
+            url=item.get('html_url'),
+            sha=item.get('sha'),
+        )
+        for item in items
+    ]
+
+class NDJSONSink:
+    """Grava registros como JSON por linha em um arquivo, pipe ou stdout ('-')"""
+
+    def __init__(self, target, mode='a'):
+        self._owned = target != '-'
+        self._stream = open(target, mode, encoding='utf-8') if self._owned else sys.stdout
+        self.written = 0
+
+    def write(self, record, **extra):
+        """Grava um registro; extra acrescenta campos à linha (ex.: type)"""
+        self.write_line({**extra, **record._asdict()})
+        self.written += 1
+
+    def write_line(self, data):
+        """Grava um objeto JSON qualquer como uma linha"""
+        self._stream.write(json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._stream.flush()  # Quem lê do outro lado vê o registro imediatamente
+
+    def write_all(self, records, **extra):
+        for record in records:
+            self.write(record, **extra)
+
+    def close(self):
+        if self._owned:
+            self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
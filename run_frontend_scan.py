@@ -1,109 +1,101 @@
 #!/usr/bin/env python3
 """
 Script para executar o GitHub Scanner diretamente do frontend
-Recebe parâmetros via linha de comando e salva resultados em JSON
+Recebe parâmetros via linha de comando e grava os resultados em NDJSON
+
+O arquivo de saída recebe uma linha JSON por evento, assim que ele acontece:
+- {"type": "start"}: termos, páginas e filtro de data do scan
+- {"type": "result"}: um item encontrado (campos de ResultRecord)
+- {"type": "term"}: contadores de um termo concluído
+- {"type": "end"}: status final e totais
+O log do scanner vai para --log-file ('-' para o console) ou é descartado.
 """
 
-import json
-import sys
+import asyncio
+import contextlib
 import os
+import sys
+import time
 import argparse
-from pathlib import Path
-from github_scan import reload_env_config, main as run_scanner
-import contextlib
-import io
+from frontend_bridge import create_scan_config
+from github_scan import Scanner
+from result_records import NDJSONSink
 
-def create_env_from_params(token, search_terms, results_per_page=30, pages=5, sleep_time=2, start_date=None, end_date=None):
-    """Cria arquivo .env temporário com os parâmetros fornecidos"""
-    env_content = f"""GITHUB_TOKEN={token}
-SEARCH_TERM={search_terms}
-RESULTS_PER_PAGE={results_per_page}
-PAGES={pages}
-SLEEP_TIME={sleep_time}
-"""
-    
-    if start_date:
-        env_content += f"START_DATE={start_date}\n"
-    if end_date:
-        env_content += f"END_DATE={end_date}\n"
-    
-    return env_content
+def open_log(log_file):
+    """Destino do log do scanner: arquivo, console ('-') ou descartado (None)"""
+    if log_file == '-':
+        return contextlib.nullcontext(sys.stdout)
+    return open(log_file or os.devnull, 'w', encoding='utf-8')
 
-def backup_restore_env():
-    """Context manager para backup e restore do .env"""
-    class EnvBackup:
-        def __init__(self):
-            self.backup_path = '.env.backup_frontend'
-            self.original_exists = os.path.exists('.env')
-            
-        def __enter__(self):
-            if self.original_exists:
-                # Faz backup do .env original
-                with open('.env', 'r') as f:
-                    content = f.read()
-                with open(self.backup_path, 'w') as f:
-                    f.write(content)
-            return self
-            
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            # Remove .env temporário
-            if os.path.exists('.env'):
-                os.remove('.env')
-            
-            # Restaura .env original
-            if self.original_exists and os.path.exists(self.backup_path):
-                os.rename(self.backup_path, '.env')
-            elif os.path.exists(self.backup_path):
-                os.remove(self.backup_path)
-    
-    return EnvBackup()
+async def stream_results(scanner, sink, counters):
+    """Grava cada evento do scan assim que ele chega e acumula os contadores"""
+    async for event in scanner.scan_events(date_range=scanner.config.date_range()):
+        sink.write_line(event)
+        if event['type'] == 'term':
+            counters['terms'] += 1
+            counters['total_results'] += event['results']
+            if event['results']:
+                counters['terms_with_results'] += 1
 
-def run_scan_with_params(token, search_terms, results_per_page=30, pages=5, sleep_time=2, start_date=None, end_date=None):
-    """Executa o scanner com parâmetros específicos"""
+def run_scan_with_params(token, search_terms, results_per_page=30, pages=5, sleep_time=2, start_date=None, end_date=None,
+                         output_file='scan_results.json', log_file=None):
+    """Executa o scanner gravando os eventos em output_file e devolve o evento final"""
+    with NDJSONSink(output_file, 'w') as sink:
+        try:
+            # Mesmos campos (e nomes do .env) que o frontend envia para o bridge
+            config = create_scan_config({
+                'GITHUB_TOKEN': token,
+                'SEARCH_TERM': search_terms,
+                'RESULTS_PER_PAGE': results_per_page,
+                'PAGES': pages,
+                'SLEEP_TIME': sleep_time,
+                'START_DATE': start_date,
+                'END_DATE': end_date,
+            })
+            if not config.search_terms:
+                raise ValueError('Nenhum termo de busca informado')
+            scanner = Scanner(config)
+        except Exception as e:
+            summary = {
+                'type': 'end',
+                'status': 'error',
+                'message': f'Erro na configuração: {str(e)}',
+                'error': str(e)
+            }
+            sink.write_line(summary)
+            return summary
     
-    try:
-        # Cria arquivo .env temporário
-        env_content = create_env_from_params(
-            token, search_terms, results_per_page, pages, sleep_time, start_date, end_date
-        )
-        
-        with backup_restore_env():
-            # Escreve .env temporário
-            with open('.env', 'w') as f:
-                f.write(env_content)
-            
-            # Captura output do scanner
-            output_buffer = io.StringIO()
-            
-            try:
-                # Redireciona stdout para capturar output
-                with contextlib.redirect_stdout(output_buffer):
-                    run_scanner()
-                
-                output = output_buffer.getvalue()
-                
-                return {
-                    'status': 'success',
-                    'message': 'Scanner executado com sucesso',
-                    'output': output,
-                    'results_found': 'resultados encontrados' in output.lower(),
-                    'total_results': output.count('📁') if '📁' in output else 0
-                }
-                
-            except Exception as e:
-                return {
-                    'status': 'error',
-                    'message': f'Erro durante execução: {str(e)}',
-                    'output': output_buffer.getvalue(),
-                    'error': str(e)
-                }
+        sink.write_line({
+            'type': 'start',
+            'terms': config.search_terms,
+            'pages': config.pages,
+            'results_per_page': config.results_per_page,
+            'date_range': config.date_range()
+        })
+        counters = {'terms': 0, 'terms_with_results': 0, 'total_results': 0}
+        started = time.perf_counter()
     
-    except Exception as e:
-        return {
-            'status': 'error',
-            'message': f'Erro na configuração: {str(e)}',
-            'error': str(e)
-        }
+        try:
+            with open_log(log_file) as log, contextlib.redirect_stdout(log):
+                asyncio.run(stream_results(scanner, sink, counters))
+            summary = {'type': 'end', 'status': 'success', 'message': 'Scanner executado com sucesso'}
+        except Exception as e:
+            summary = {
+                'type': 'end',
+                'status': 'error',
+                'message': f'Erro durante execução: {str(e)}',
+                'error': str(e)
+            }
+        finally:
+            scanner.close()
+    
+        summary.update(counters)
+        # Sem nenhuma requisição (ou com um backend que falhou) não há transporte para consultar
+        stats = scanner.request_stats
+        summary['requests'] = stats.summary()['requests'] if stats is not None else 0
+        summary['elapsed_s'] = round(time.perf_counter() - started, 3)
+        sink.write_line(summary)
+        return summary
 
 def main():
     parser = argparse.ArgumentParser(description='GitHub Scanner Frontend Interface')
@@ -114,7 +106,8 @@ def main():
     parser.add_argument('--sleep-time', type=int, default=2, help='Sleep time between requests')
     parser.add_argument('--start-date', help='Start date filter (YYYY-MM-DD)')
     parser.add_argument('--end-date', help='End date filter (YYYY-MM-DD)')
-    parser.add_argument('--output-file', default='scan_results.json', help='Output JSON file')
+    parser.add_argument('--output-file', default='scan_results.json', help='Output NDJSON file (one event per line)')
+    parser.add_argument('--log-file', help="Scanner log file ('-' for the console, discarded by default)")
     
     args = parser.parse_args()
     
@@ -128,13 +121,11 @@ def main():
         pages=args.pages,
         sleep_time=args.sleep_time,
         start_date=args.start_date,
-        end_date=args.end_date
+        end_date=args.end_date,
+        output_file=args.output_file,
+        log_file=args.log_file
     )
     
-    # Salva resultado em JSON
-    with open(args.output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
-    
     print(f"\n📄 Resultados salvos em: {args.output_file}")
     
     # Output direto para o console também
@@ -152,4 +143,3 @@ def main():
 
 if __name__ == '__main__':
     sys.exit(main())
-
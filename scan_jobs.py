@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Gerenciador de scans do servidor: um job por scan, com ID próprio
+
+Cada job guarda status, progresso (termos concluídos e resultados) e um
+log de eventos numerados (resultados, páginas, termos e mudanças de status)
+preenchido conforme o scan avança; quem acompanha o job espera novos eventos
+a partir do último número que viu. Os jobs rodam em
+um pool limitado de workers; os que passam do limite ficam na fila. Um job em
+fila ou em execução pode ser cancelado, e os jobs finalizados mais antigos são
+descartados para a memória não crescer sem limite.
+"""
+
+import asyncio
+import bisect
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from frontend_bridge import create_scan_config
+from github_scan import Scanner
+
+FINISHED = ('completed', 'failed', 'cancelled')
+
+# Intervalo, em segundos, entre verificações do pedido de cancelamento
+CANCEL_POLL = 0.1
+
+class ScanJob:
+    """Estado de um scan: status, progresso e resultados na ordem em que chegaram"""
+
+    def __init__(self, config):
+        self.id = uuid.uuid4().hex[:12]
+        self.config = create_scan_config(config)
+        self.status = 'queued'
+        self.message = 'Aguardando um worker livre'
+        self.terms_total = len(dict.fromkeys(self.config.search_terms))  # Termos repetidos são buscados uma vez
+        self.terms_done = 0
+        self.results = []
+        self.events = []
+        self._result_seqs = []
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._cancelled = threading.Event()
+        with self._lock:
+            self._status_event()
+
+    @property
+    def finished(self):
+        return self.status in FINISHED
+
+    @property
+    def last_seq(self):
+        return len(self.events)
+
+    def _append(self, event):
+        """Numera o evento (seq, a partir de 1), guarda no log e acorda quem espera; requer o lock"""
+        event = {'seq': len(self.events) + 1, **event}
+        self.events.append(event)
+        self._changed.notify_all()
+        return event
+
+    def _status_event(self):
+        return self._append({'type': 'status', 'status': self.status, 'message': self.message})
+
+    def add_event(self, event):
+        """Acrescenta um evento do scan ao log, aos resultados e ao progresso"""
+        with self._lock:
+            event = self._append(event)
+            if event['type'] == 'result':
+                self.results.append(event)
+                self._result_seqs.append(event['seq'])
+            elif event['type'] == 'term':
+                self.terms_done += 1
+                self.message = f"{self.terms_done}/{self.terms_total} termo(s) concluído(s)"
+
+    def set_status(self, status, message):
+        with self._lock:
+            self.status = status
+            self.message = message
+            if status == 'running':
+                self.started_at = time.time()
+            elif status in FINISHED:
+                self.finished_at = time.time()
+            self._status_event()
+
+    def wait_events(self, after, timeout=None):
+        """Eventos com seq maior que after, esperando até timeout se ainda não há nenhum
+
+        Devolve (eventos, finalizado); uma lista vazia com o job em andamento
+        significa que o timeout passou.
+        """
+        with self._lock:
+            if len(self.events) <= after and not self.finished:
+                self._changed.wait(timeout)
+            return self.events[after:], self.finished
+
+    def cancel(self):
+        """Pede o cancelamento; devolve False se o job já terminou"""
+        with self._lock:
+            if self.finished:
+                return False
+            self._cancelled.set()
+            if self.status == 'queued':
+                self.status = 'cancelled'
+                self.message = 'Cancelado antes de iniciar'
+                self.finished_at = time.time()
+                self._status_event()
+        return True
+
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def snapshot(self):
+        """Status do job para a API (sem o token nem os resultados)"""
+        with self._lock:
+            return {
+                'job_id': self.id,
+                'status': self.status,
+                'message': self.message,
+                'progress': {
+                    'terms_done': self.terms_done,
+                    'terms_total': self.terms_total,
+                    'results': len(self.results),
+                },
+                'last_seq': len(self.events),
+                'created_at': self.created_at,
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+            }
+
+    def results_snapshot(self, after=0, limit=None):
+        """Status e os resultados com seq maior que after, no máximo limit
+
+        next_cursor é o after da chamada seguinte: o seq do último resultado
+        devolvido se a página foi cortada por limit (has_more), senão o último
+        seq do job, para a próxima chamada trazer só o que chegar depois.
+        """
+        with self._lock:
+            start = bisect.bisect_right(self._result_seqs, after)
+            end = len(self.results) if limit is None else min(len(self.results), start + limit)
+            results = self.results[start:end]
+            has_more = end < len(self.results)
+            next_cursor = results[-1]['seq'] if has_more else len(self.events)
+        return {**self.snapshot(), 'results': results, 'next_cursor': next_cursor, 'has_more': has_more}
+
+class JobManager:
+    """Executa jobs de scan em um pool limitado e guarda os mais recentes"""
+
+    def __init__(self, max_workers=2, max_jobs=100, pool=None):
+        self.max_workers = max(1, max_workers)
+        self.max_jobs = max(1, max_jobs)
+        self.pool = pool
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scan-job')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, config):
+        """Cria um job com a configuração do frontend (nomes do .env) e o põe na fila"""
+        job = ScanJob(config)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._evict()
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def latest(self):
+        """Job criado por último, ou None"""
+        with self._lock:
+            return next(reversed(self._jobs.values()), None)
+
+    def cancel(self, job_id):
+        """Cancela um job; devolve None se ele não existe"""
+        job = self.get(job_id)
+        return None if job is None else job.cancel()
+
+    def shutdown(self):
+        """Cancela os jobs pendentes e espera os workers terminarem"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            job.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _evict(self):
+        """Remove os jobs finalizados mais antigos acima de max_jobs"""
+        excess = len(self._jobs) - self.max_jobs
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished][:max(excess, 0)]:
+            del self._jobs[job_id]
+
+    def _run(self, job):
+        """Executa um job em um worker do pool (processo pré-iniciado ou thread local)"""
+        if job.cancelled():
+            return
+        job.set_status('running', 'Scanner em execução...')
+        try:
+            if self.pool:
+                status, message = self.pool.run(job.config, job.add_event, job.cancelled)
+            else:
+                scanner = Scanner(job.config)
+                try:
+                    status, message = run_scan(scanner, job.add_event, job.cancelled)
+                finally:
+                    scanner.close()
+        except Exception as e:
+            status, message = 'failed', f'Erro durante o scanner: {str(e)}'
+        if status == 'completed':
+            message = f"Scanner concluído: {len(job.results)} resultado(s)"
+        job.set_status(status, message)
+
+def run_scan(scanner, emit, cancelled):
+    """Executa o scan configurado chamando emit(evento); devolve (status, mensagem)
+
+    cancelled() é consultado periodicamente e, se verdadeiro, interrompe o scan.
+    """
+    try:
+        asyncio.run(_consume(scanner, emit, cancelled))
+        return 'completed', 'Scanner concluído'
+    except asyncio.CancelledError:
+        return 'cancelled', 'Cancelado pelo usuário'
+    except Exception as e:
+        return 'failed', f'Erro durante o scanner: {str(e)}'
+
+async def _consume(scanner, emit, cancelled):
+    task = asyncio.current_task()
+
+    async def watch():
+        while not cancelled():
+            await asyncio.sleep(CANCEL_POLL)
+        task.cancel()
+
+    watcher = asyncio.ensure_future(watch())
+    try:
+        async for event in scanner.scan_events(date_range=scanner.config.date_range(), progress=True):
+            emit(event)
+    finally:
+        watcher.cancel()
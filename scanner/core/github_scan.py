@@ -4,12 +4,17 @@ GitHub Security Scanner - Core scanning functionality
 """
 
 import os
-import time
-import requests
+import sys
 import urllib.parse
 from pathlib import Path
 from dotenv import load_dotenv
 
+# Add project root to path para usar o agendador compartilhado
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from rate_limit import RateLimitScheduler
+from transport import create_transport
+
 def reload_env_config():
     """Reload environment variables from .env file"""
     env_path = Path(__file__).parent.parent.parent / '.env'
@@ -37,6 +42,12 @@ headers = {
     'Authorization': f'token {TOKEN}',
     'Accept': 'application/vnd.github.v3+json'
 }
+scheduler = RateLimitScheduler(fallback_wait=SLEEP_TIME)
+transport = create_transport(os.getenv('HTTP_BACKEND', 'requests'), headers)
+
+def github_get(url):
+    """GET autenticado passando pelo agendador de rate limit"""
+    return scheduler.request(lambda: transport.get(url))
 
 def detect_data_type(term):
     """Detecta o tipo de dado baseado no padrão do termo"""
@@ -186,7 +197,7 @@ def search_github(term, page, date_range=None):
         test_url = f'https://api.github.com/search/code?q={encoded_test}&per_page=1'
         
         print(f"🗒️ Testando filtro de data...")
-        test_response = requests.get(test_url, headers=headers)
+        test_response = github_get(test_url)
         
         if test_response.status_code == 200:
             test_count = test_response.json().get('total_count', 0)
@@ -201,14 +212,12 @@ def search_github(term, page, date_range=None):
             print(f"⚠️  Erro ao testar filtro de data: {test_response.status_code}")
             print(f"Continuando sem filtro de data")
             date_range = None
-        
-        time.sleep(0.5)  # Pequena pausa após teste
     
     for query in queries:
         encoded_query = urllib.parse.quote(query)
         url = f'https://api.github.com/search/code?q={encoded_query}&per_page={RESULTS_PER_PAGE}&page={page}'
         
-        response = requests.get(url, headers=headers)
+        response = github_get(url)
         
         if response.status_code == 200:
             data = response.json()
@@ -219,17 +228,13 @@ def search_github(term, page, date_range=None):
                 print(f"✅ Query: {query}")
                 print(f"📈 Total: {total_count} resultados")
                 return items
-            
-            time.sleep(0.5)  # Pequena pausa entre queries
         
         elif response.status_code == 403:
-            print(f"⚠️  Rate limit atingido. Aguardando {SLEEP_TIME} segundos...")
-            time.sleep(SLEEP_TIME)
-            return search_github(term, page, date_range)  # Tenta novamente
+            print(f"⚠️  Acesso negado mesmo após aguardar o rate limit")
+            return []
         
         else:
             print(f"❌ Erro {response.status_code} na query: {query}")
-            time.sleep(0.5)  # Pausa após erro
     
     return []
 
@@ -268,7 +273,6 @@ def main():
                 file_path = item['path']
                 html_url = item['html_url']
                 print(f"📁 {repo} - {file_path}\n🔗 {html_url}\n")
-            time.sleep(SLEEP_TIME)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
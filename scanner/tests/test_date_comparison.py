@@ -3,8 +3,8 @@
 Script para comparar resultados com e sem filtro de data
 """
 
-import requests
 import os
+import sys
 from dotenv import load_dotenv
 import urllib.parse
 import time
@@ -14,16 +14,14 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from core.github_scan import reload_env_config
+from transport import create_transport
 
 # Load environment variables
 env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(env_path)
 TOKEN = os.getenv('GITHUB_TOKEN')
 
-headers = {
-    'Authorization': f'token {TOKEN}',
-    'Accept': 'application/vnd.github.v3+json'
-}
+transport = create_transport(headers={'Authorization': f'token {TOKEN}'})
 
 def test_comparison(term):
     print(f"🧪 Comparando resultados para: {term}")
@@ -36,7 +34,7 @@ def test_comparison(term):
     print(f"\nSEM filtro de data:")
     print(f"Query: {query1}")
     
-    response1 = requests.get(url1, headers=headers)
+    response1 = transport.get(url1)
     if response1.status_code == 200:
         data1 = response1.json()
         total1 = data1.get('total_count', 0)
@@ -62,7 +60,7 @@ def test_comparison(term):
     print(f"\nCOM filtro de data (pushed 2020-2024):")
     print(f"Query: {query2}")
     
-    response2 = requests.get(url2, headers=headers)
+    response2 = transport.get(url2)
     if response2.status_code == 200:
         data2 = response2.json()
         total2 = data2.get('total_count', 0)
@@ -3,52 +3,107 @@
 Simple HTTP server para servir o frontend do CodePhoenix
 """
 
+import gzip
 import http.server
-import socketserver
 import json
-import subprocess
 import os
-import threading
+import re
 import urllib.parse
 from pathlib import Path
 
+from result_records import ResultRecord
+from scan_jobs import JobManager
+from worker_pool import WorkerPool
+
 PORT = 8080
 FRONTEND_DIR = Path(__file__).parent / 'frontend'
 
-# Global variables to store scan state
-scan_results = []
-scan_status = {'status': 'idle', 'message': ''}
-current_scan_process = None
+# Scans simultâneos (os demais esperam na fila) e jobs finalizados mantidos em memória
+SCAN_WORKERS = int(os.getenv('SCAN_WORKERS', '2'))
+SCAN_JOBS_KEPT = int(os.getenv('SCAN_JOBS_KEPT', '100'))
+# Segundos que uma conexão keep-alive pode ficar ociosa
+KEEPALIVE_TIMEOUT = int(os.getenv('KEEPALIVE_TIMEOUT', '15'))
+# Respostas JSON a partir deste tamanho (bytes) vão com gzip se o cliente aceitar
+GZIP_MIN_SIZE = 1024
+# Máximo de resultados por página em /api/results?limit=
+RESULTS_PAGE_MAX = 5000
+# Campos aceitos em /api/results?fields= (seq vai sempre)
+RESULT_FIELDS = ('type',) + ResultRecord._fields
+
+# Segundos sem eventos até o stream SSE mandar um comentário para manter a conexão
+SSE_HEARTBEAT = 15
+# Tempo, em ms, que o EventSource espera antes de reconectar
+SSE_RETRY_MS = 2000
+# Scans executados por um processo worker antes de ele ser substituído
+SCAN_WORKER_MAX_JOBS = int(os.getenv('SCAN_WORKER_MAX_JOBS', '50'))
+
+# Criado em main(): os workers (spawn) reimportam este módulo e não devem criar outro pool
+jobs = None
+
+JOB_ROUTE = re.compile(r'^/api/scan/([0-9a-f]+)$')
+JOB_RESULTS_ROUTE = re.compile(r'^/api/results/([0-9a-f]+)$')
+JOB_CANCEL_ROUTE = re.compile(r'^/api/scan/([0-9a-f]+)/cancel$')
+JOB_EVENTS_ROUTE = re.compile(r'^/api/scan/([0-9a-f]+)/events$')
+
+class CodePhoenixServer(http.server.ThreadingHTTPServer):
+    """Servidor com uma thread por conexão: um cliente lento não bloqueia os demais"""
+    
+    daemon_threads = True
+    request_queue_size = 128
 
 class CodePhoenixHandler(http.server.SimpleHTTPRequestHandler):
     
+    # HTTP/1.1: a conexão fica aberta entre requisições (as respostas têm Content-Length, exceto o SSE)
+    protocol_version = 'HTTP/1.1'
+    # Conexões keep-alive ociosas por mais tempo que isso são fechadas
+    timeout = KEEPALIVE_TIMEOUT
+    # Cabeçalhos e corpo saem em escritas separadas; sem Nagle não esperam o ACK atrasado do cliente
+    disable_nagle_algorithm = True
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=str(FRONTEND_DIR), **kwargs)
     
     def do_GET(self):
         """Handle GET requests"""
-        if self.path == '/api/results':
+        path = urllib.parse.urlsplit(self.path).path
+        job_match = JOB_ROUTE.match(path)
+        results_match = JOB_RESULTS_ROUTE.match(path)
+        events_match = JOB_EVENTS_ROUTE.match(path)
+        if path == '/api/results':
             self.handle_results_request()
-        elif self.path == '/api/status':
+        elif path == '/api/status':
             self.handle_status_request()
+        elif job_match:
+            self.handle_job_request(job_match.group(1))
+        elif results_match:
+            self.handle_results_request(results_match.group(1))
+        elif events_match:
+            self.handle_events_request(events_match.group(1))
         else:
             # Serve static files
             super().do_GET()
     
     def do_POST(self):
         """Handle POST requests para API calls"""
-        if self.path == '/api/scan':
-            self.handle_scan_request()
+        path = urllib.parse.urlsplit(self.path).path
+        cancel_match = JOB_CANCEL_ROUTE.match(path)
+        # O corpo é sempre lido para a próxima requisição da conexão começar no lugar certo
+        post_data = self.read_body()
+        if path == '/api/scan':
+            self.handle_scan_request(post_data)
+        elif cancel_match:
+            self.handle_cancel_request(cancel_match.group(1))
         else:
             self.send_error(404, "API endpoint not found")
     
-    def handle_scan_request(self):
+    def read_body(self):
+        """Lê o corpo da requisição conforme o Content-Length"""
+        content_length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(content_length) if content_length else b''
+    
+    def handle_scan_request(self, post_data):
         """Handle scan requests do frontend"""
         try:
-            # Lê o body da requisição
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            
             # Parse JSON
             config = json.loads(post_data.decode('utf-8'))
             
@@ -71,79 +126,143 @@ class CodePhoenixHandler(http.server.SimpleHTTPRequestHandler):
             # Remove valores None
             bridge_config = {k: v for k, v in bridge_config.items() if v is not None}
             
-            # Executa o scanner em thread separada
-            def run_scanner():
-                try:
-                    # Chama o bridge script
-                    result = subprocess.run([
-                        'python3', 'frontend_bridge.py', 
-                        json.dumps(bridge_config)
-                    ], capture_output=True, text=True, cwd=Path(__file__).parent)
-                    
-                    if result.returncode == 0:
-                        print("Scanner executado com sucesso")
-                    else:
-                        print(f"Erro no scanner: {result.stderr}")
-                        
-                except Exception as e:
-                    print(f"Erro executando scanner: {e}")
-            
-            # Inicia scanner em background
-            scanner_thread = threading.Thread(target=run_scanner)
-            scanner_thread.daemon = True
-            scanner_thread.start()
+            # Enfileira o scan no pool de workers
+            job = jobs.submit(bridge_config)
             
             # Resposta imediata
             self.send_json_response({
                 'status': 'started',
-                'message': 'Scanner iniciado com sucesso'
-            })
+                'message': 'Scanner iniciado com sucesso',
+                'job_id': job.id,
+                'status_url': f'/api/scan/{job.id}',
+                'results_url': f'/api/results/{job.id}'
+            }, 202)
             
         except json.JSONDecodeError:
             self.send_json_response({'error': 'JSON inválido'}, 400)
         except Exception as e:
             self.send_json_response({'error': f'Erro interno: {str(e)}'}, 500)
     
-    def handle_results_request(self):
-        """Handle requests para resultados do scan"""
-        global scan_results, scan_status
+    def find_job(self, job_id=None):
+        """Job pelo ID (ou o mais recente); responde 404 se não existir"""
+        job = jobs.get(job_id) if job_id else jobs.latest()
+        if job is None and job_id:
+            self.send_json_response({'error': f'Scan não encontrado: {job_id}'}, 404)
+        return job
+    
+    def handle_results_request(self, job_id=None):
+        """Handle requests para resultados do scan (sem ID: o scan mais recente)
         
+        ?limit= pagina os resultados e ?cursor= (ou ?since=, o último seq visto) traz só
+        os seguintes; a resposta diz em next_cursor de onde continuar. ?fields= escolhe
+        os campos de cada resultado.
+        """
         try:
-            # Simula resultados para demonstração
-            # Na implementação real, isso viria do arquivo de resultados
-            if scan_status['status'] == 'completed':
-                self.send_json_response({
-                    'status': 'completed',
-                    'results': scan_results
-                })
-            else:
-                self.send_json_response({
-                    'status': 'running',
-                    'message': 'Scanner em execução...'
-                })
+            try:
+                after, limit, fields = parse_results_query(self.path)
+            except ValueError as e:
+                self.send_json_response({'error': str(e)}, 400)
+                return
+            job = self.find_job(job_id)
+            if job is None:
+                if not job_id:
+                    self.send_json_response({'status': 'idle', 'results': []})
+                return
+            data = job.results_snapshot(after, limit)
+            if fields:
+                data['results'] = [{key: result[key] for key in fields if key in result} for result in data['results']]
+            self.send_json_response(data)
         except Exception as e:
             self.send_json_response({'error': f'Erro ao obter resultados: {str(e)}'}, 500)
     
     def handle_status_request(self):
-        """Handle requests para status do scan"""
-        global scan_status
-        
+        """Handle requests para status do scan mais recente"""
         try:
-            self.send_json_response(scan_status)
+            job = jobs.latest()
+            self.send_json_response(job.snapshot() if job else {'status': 'idle', 'message': ''})
         except Exception as e:
             self.send_json_response({'error': f'Erro ao obter status: {str(e)}'}, 500)
     
+    def handle_job_request(self, job_id):
+        """Handle requests para status e progresso de um scan"""
+        job = self.find_job(job_id)
+        if job is not None:
+            self.send_json_response(job.snapshot())
+    
+    def handle_events_request(self, job_id):
+        """Stream SSE dos eventos de um scan (status, páginas, resultados e termos) conforme acontecem
+        
+        Cada evento leva seu seq como id; ao reconectar, o EventSource manda o último no
+        cabeçalho Last-Event-ID e o stream continua dali (?last_event_id= faz o mesmo na
+        primeira conexão). Com o scan finalizado e nada novo, responde 204 para o
+        navegador não reconectar.
+        """
+        job = self.find_job(job_id)
+        if job is None:
+            return
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        last_id = self.headers.get('Last-Event-ID') or query.get('last_event_id', ['0'])[0]
+        try:
+            seq = max(0, int(last_id))
+        except ValueError:
+            self.send_json_response({'error': f'Last-Event-ID inválido: {last_id}'}, 400)
+            return
+        if job.finished and seq >= job.last_seq:
+            self.send_response(204)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
+        # Sem Content-Length: o stream termina quando a conexão é fechada
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        try:
+            self.wfile.write(f'retry: {SSE_RETRY_MS}\n\n'.encode('utf-8'))
+            while True:
+                events, finished = job.wait_events(seq, timeout=SSE_HEARTBEAT)
+                if not events and finished:
+                    break
+                chunk = ''.join(format_sse(event) for event in events) if events else ': heartbeat\n\n'
+                self.wfile.write(chunk.encode('utf-8'))
+                self.wfile.flush()
+                if events:
+                    seq = events[-1]['seq']
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # O cliente fechou o stream
+    
+    def handle_cancel_request(self, job_id):
+        """Handle requests para cancelar um scan em fila ou em execução"""
+        job = self.find_job(job_id)
+        if job is None:
+            return
+        if job.cancel():
+            self.send_json_response({**job.snapshot(), 'message': 'Cancelamento solicitado'})
+        else:
+            self.send_json_response({**job.snapshot(), 'error': 'Scan já finalizado'}, 409)
+    
     def send_json_response(self, data, status=200):
-        """Envia resposta JSON"""
+        """Envia resposta JSON (com gzip se o cliente aceitar e valer a pena)"""
+        response = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        compress = len(response) >= GZIP_MIN_SIZE and accepts_gzip(self.headers.get('Accept-Encoding', ''))
+        if compress:
+            response = gzip.compress(response, compresslevel=5)
         self.send_response(status)
         self.send_header('Content-type', 'application/json')
+        if compress:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(response)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
         
-        response = json.dumps(data, ensure_ascii=False)
-        self.wfile.write(response.encode('utf-8'))
+        self.wfile.write(response)
     
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
@@ -151,12 +270,53 @@ class CodePhoenixHandler(http.server.SimpleHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
     def log_message(self, format, *args):
         """Custom log format"""
         print(f"[{self.address_string()}] {format % args}")
 
+def parse_results_query(path):
+    """(after, limit, campos) da query string de /api/results; ValueError se inválida"""
+    query = urllib.parse.parse_qs(urllib.parse.urlsplit(path).query)
+    
+    def number(name, minimum):
+        value = query.get(name, [None])[0]
+        if value is None:
+            return None
+        if not value.isdigit() or int(value) < minimum:
+            raise ValueError(f'Parâmetro {name} inválido: {value}')
+        return int(value)
+    
+    after = number('cursor', 0)
+    if after is None:
+        after = number('since', 0) or 0
+    limit = number('limit', 1)
+    if limit is not None:
+        limit = min(limit, RESULTS_PAGE_MAX)
+    fields = None
+    if 'fields' in query:
+        fields = [field for field in ','.join(query['fields']).split(',') if field]
+        unknown = [field for field in fields if field not in RESULT_FIELDS]
+        if unknown:
+            raise ValueError(f"Campo(s) desconhecido(s): {', '.join(unknown)}")
+        fields = ['seq'] + fields
+    return after, limit, fields
+
+def accepts_gzip(accept_encoding):
+    """Se o cabeçalho Accept-Encoding aceita gzip (q=0 recusa)"""
+    for coding in accept_encoding.split(','):
+        name, _, params = coding.strip().partition(';')
+        if name.strip().lower() in ('gzip', '*'):
+            return params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+def format_sse(event):
+    """Evento no formato text/event-stream: id (seq), nome (tipo) e o JSON"""
+    data = json.dumps(event, ensure_ascii=False)
+    return f"id: {event['seq']}\nevent: {event['type']}\ndata: {data}\n\n"
+
 def main():
     """Inicia o servidor"""
     
@@ -165,12 +325,18 @@ def main():
         print(f"Erro: Diretório frontend não encontrado em {FRONTEND_DIR}")
         return
     
+    # Workers do scanner pré-iniciados, prontos antes da primeira requisição
+    global jobs
+    pool = WorkerPool(SCAN_WORKERS, SCAN_WORKER_MAX_JOBS)
+    jobs = JobManager(SCAN_WORKERS, SCAN_JOBS_KEPT, pool)
+    
     # Cria o servidor
-    with socketserver.TCPServer(("", PORT), CodePhoenixHandler) as httpd:
+    with CodePhoenixServer(("", PORT), CodePhoenixHandler) as httpd:
         print(f"🚀 CodePhoenix Server iniciado!")
         print(f"🌐 Frontend disponível em: http://localhost:{PORT}")
         print(f"📁 Servindo arquivos de: {FRONTEND_DIR}")
         print(f"📊 API endpoint: http://localhost:{PORT}/api/scan")
+        print(f"⚙️  {SCAN_WORKERS} worker(s) de scan pré-iniciado(s), reciclados a cada {SCAN_WORKER_MAX_JOBS} scans")
         print(f"\n⏹️  Pressione Ctrl+C para parar o servidor")
         print("="*50)
         
@@ -178,6 +344,9 @@ def main():
             httpd.serve_forever()
         except KeyboardInterrupt:
             print("\n\n🛱 Servidor interrompido pelo usuário")
+        finally:
+            jobs.shutdown()
+            pool.close()
             print("👋 Obrigado por usar o CodePhoenix!")
 
 if __name__ == "__main__":
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Estatísticas históricas por estratégia de busca e tipo de dado
+
+Cada requisição de uma estratégia registra se trouxe itens, veio vazia, foi
+inválida (422) ou falhou, e sua latência. Em execuções seguintes as
+estratégias são reordenadas pelo rendimento esperado por requisição e as que
+nunca rendem são descartadas.
+
+Relatório: python strategy_stats.py [caminho do banco]
+"""
+
+import os
+import re
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+# Amostras mínimas antes de reordenar ou descartar uma estratégia
+MIN_SAMPLES = 10
+
+# Requisições sem nenhum hit a partir das quais a estratégia é descartada
+DROP_AFTER = 30
+
+def strategy_key(term, query, date_range=None):
+    """Template da estratégia: a query com o termo (e suas partes) substituído"""
+    if date_range and query.endswith(f' {date_range}'):
+        query = query[:-len(date_range) - 1]
+    parts = {term: '{term}'}
+    if '@' in term:
+        username, _, domain = term.partition('@')
+        parts.setdefault(domain, '{domain}')
+        parts.setdefault(username, '{username}')
+    clean_url = term.replace('https://', '').replace('http://', '').replace('ftp://', '')
+    parts.setdefault(clean_url, '{clean_url}')
+    # Uma única passada, a parte mais longa primeiro: um placeholder já inserido
+    # ({domain}) não pode ser reescrito por outra parte (um username "a")
+    pattern = re.compile('|'.join(re.escape(part) for part in sorted(parts, key=len, reverse=True) if part))
+    return pattern.sub(lambda match: parts[match.group(0)], query)
+
+class StrategyStats:
+    """Banco SQLite com o histórico de resultados de cada estratégia"""
+
+    def __init__(self, path='.cache/strategy_stats.sqlite3'):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS strategy_stats (
+                data_type TEXT NOT NULL,
+                strategy TEXT NOT NULL,
+                requests INTEGER NOT NULL DEFAULT 0,
+                hits INTEGER NOT NULL DEFAULT 0,
+                empties INTEGER NOT NULL DEFAULT 0,
+                invalid INTEGER NOT NULL DEFAULT 0,
+                errors INTEGER NOT NULL DEFAULT 0,
+                latency_total REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (data_type, strategy)
+            )
+        """)
+        self._conn.commit()
+
+    def record(self, data_type, strategy, status, item_count, latency):
+        """Registra o resultado de uma requisição da estratégia"""
+        hit = int(status == 200 and item_count > 0)
+        empty = int(status == 200 and item_count == 0)
+        invalid = int(status == 422)
+        error = int(status not in (200, 422))
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO strategy_stats VALUES (?, ?, 1, ?, ?, ?, ?, ?)
+                ON CONFLICT (data_type, strategy) DO UPDATE SET
+                    requests = requests + 1,
+                    hits = hits + excluded.hits,
+                    empties = empties + excluded.empties,
+                    invalid = invalid + excluded.invalid,
+                    errors = errors + excluded.errors,
+                    latency_total = latency_total + excluded.latency_total
+            """, (data_type, strategy, hit, empty, invalid, error, latency))
+            self._conn.commit()
+
+    def rows(self, data_type=None):
+        query = ("SELECT data_type, strategy, requests, hits, empties, invalid, errors, latency_total "
+                 "FROM strategy_stats")
+        params = ()
+        if data_type:
+            query += " WHERE data_type = ?"
+            params = (data_type,)
+        with self._lock:
+            return self._conn.execute(query + " ORDER BY data_type, strategy", params).fetchall()
+
+    def order(self, term, data_type, queries):
+        """Reordena as queries pelo rendimento histórico e remove as que nunca rendem"""
+        known = {row[1]: row for row in self.rows(data_type)}
+        scored = []
+        for position, query in enumerate(queries):
+            row = known.get(strategy_key(term, query))
+            requests, hits = (row[2], row[3]) if row else (0, 0)
+            if requests >= DROP_AFTER and hits == 0:
+                continue
+            if requests >= MIN_SAMPLES:
+                score = hits / requests
+            else:
+                score = None  # Pouco histórico: mantém a posição original
+            scored.append((position, query, score))
+
+        if not scored:
+            return queries[:1]  # Sempre mantém a estratégia principal
+
+        learned = sorted((s for s in scored if s[2] is not None), key=lambda s: (-s[2], s[0]))
+        learned_iter = iter(learned)
+        # Estratégias sem histórico ficam no lugar; as com histórico são ordenadas entre si
+        return [next(learned_iter)[1] if score is not None else query for _, query, score in scored]
+
+    def report(self):
+        """Tabela de rendimento por estratégia: quais valem a quota gasta"""
+        current_type = None
+        for data_type, strategy, requests, hits, empties, invalid, errors, latency_total in self.rows():
+            if data_type != current_type:
+                current_type = data_type
+                print(f"\n🏷️  {data_type.upper()}")
+                print(f"   {'Estratégia':<40} {'Req':>5} {'Hits':>5} {'Vazias':>6} {'422':>4} {'Erros':>5} "
+                      f"{'Rend.':>6} {'Lat.':>7}")
+            hit_rate = hits / requests if requests else 0.0
+            latency_ms = latency_total / requests * 1000 if requests else 0.0
+            if requests >= DROP_AFTER and hits == 0:
+                verdict = '❌ descartada'
+            elif requests < MIN_SAMPLES:
+                verdict = '⏳ poucos dados'
+            else:
+                verdict = '✅ vale a quota' if hits else '⚠️  sem hits'
+            print(f"   {strategy[:40]:<40} {requests:>5} {hits:>5} {empties:>6} {invalid:>4} {errors:>5} "
+                  f"{hit_rate:>6.0%} {latency_ms:>5.0f}ms {verdict}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else os.getenv('STRATEGY_STATS_PATH', '.cache/strategy_stats.sqlite3')
+    if not Path(path).exists():
+        print(f"❌ Nenhuma estatística encontrada em {path}")
+        return 1
+    print("📊 Rendimento histórico das estratégias de busca")
+    print("=" * 60)
+    StrategyStats(path).report()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
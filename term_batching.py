@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Agrupamento de termos em queries com OR
+
+Vários termos são buscados em uma única query ("a" OR "b" OR "c" in:file),
+respeitando os limites da busca do GitHub (256 caracteres e 5 operadores).
+Um grupo sem resultados descarta todos os seus termos com uma requisição;
+quando o grupo cabe em uma página, cada item é atribuído aos termos que
+aparecem nos fragmentos de text-match.
+"""
+
+from query_validator import MAX_QUERY_LENGTH, equivalence_key
+
+# Limite de operadores da sintaxe de busca do GitHub
+MAX_OPERATORS = 5
+
+# Accept que inclui os fragmentos com o texto encontrado em cada item
+TEXT_MATCH_ACCEPT = 'application/vnd.github.text-match+json'
+
+# Tipos cujas estratégias são mais amplas que o termo exato (domínio do email,
+# URL sem protocolo): um grupo vazio não prova que o termo não tem resultados
+UNBATCHABLE_TYPES = ('email', 'url')
+
+QUALIFIERS = 'in:file'
+
+def is_batchable(term, data_type):
+    """Se um grupo vazio prova que o termo não tem resultados
+
+    Só vale quando nenhuma estratégia do termo é mais ampla que a frase exata: termos
+    com várias palavras (ou pontuação, que a busca trata como espaço) também são
+    buscados sem aspas, como um AND das palavras, que acha o que a frase não acha.
+    """
+    if data_type in UNBATCHABLE_TYPES or '"' in term or term.strip() != term:
+        return False
+    return equivalence_key(f'"{term}"') == equivalence_key(term)
+
+def build_batch_query(terms):
+    return ' OR '.join(f'"{term}"' for term in terms) + f' {QUALIFIERS}'
+
+def batch_terms(terms):
+    """Divide os termos em grupos que respeitam os limites de tamanho e operadores"""
+    batches = []
+    current = []
+    for term in terms:
+        candidate = current + [term]
+        if current and (len(candidate) - 1 > MAX_OPERATORS
+                        or len(build_batch_query(candidate)) > MAX_QUERY_LENGTH):
+            batches.append(current)
+            candidate = [term]
+        current = candidate
+    if current:
+        batches.append(current)
+    return batches
+
+def assign_items(terms, items):
+    """{termo: itens} pelos fragmentos de text-match em que o termo aparece"""
+    assigned = {term: [] for term in terms}
+    lowered = [(term, term.lower()) for term in terms]
+    for item in items:
+        fragments = [m.get('fragment', '').lower() for m in item.get('text_matches', [])]
+        for term, needle in lowered:
+            if any(needle in fragment for fragment in fragments):
+                assigned[term].append(item)
+    return assigned
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Leitura de termos em streaming de um arquivo ou do stdin
+
+Um termo por linha, em UTF-8, opcionalmente comprimido com gzip (detectado
+pelos bytes mágicos). Os termos são lidos sob demanda, então a memória não
+depende do tamanho da lista. O progresso é salvo por offset de bytes: o
+checkpoint aponta para o fim do último termo a partir do qual todos os
+anteriores já terminaram, e um scan interrompido recomeça dali.
+"""
+
+import gzip
+import json
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Termos concluídos entre duas gravações do checkpoint
+SAVE_EVERY = 100
+
+def open_terms(path):
+    """Abre a lista de termos em modo binário; '-' é o stdin"""
+    raw = sys.stdin.buffer if path == '-' else open(path, 'rb')
+    magic = raw.peek(2)[:2] if hasattr(raw, 'peek') else b''
+    if magic == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=raw)
+    return raw
+
+def iter_terms(path, offset=0):
+    """Gera (termo, offset do fim da linha) a partir do offset informado
+
+    Linhas vazias e comentários (#) são ignorados. Offsets são do conteúdo
+    descomprimido, então valem igualmente para arquivos gzip.
+    """
+    stream = open_terms(path)
+    try:
+        if offset and stream.seekable():
+            stream.seek(offset)
+        else:
+            remaining = offset
+            while remaining > 0:
+                chunk = stream.read(min(remaining, 1 << 20))
+                if not chunk:
+                    return
+                remaining -= len(chunk)
+        position = offset
+        for line in stream:
+            position += len(line)
+            term = line.decode('utf-8', errors='replace').strip()
+            if term and not term.startswith('#'):
+                yield term, position
+    finally:
+        # GzipFile não fecha o arquivo que recebeu: os dois são fechados (exceto o stdin)
+        for handle in (stream, getattr(stream, 'fileobj', None)):
+            if handle is not None and handle is not sys.stdin.buffer:
+                handle.close()
+
+class Checkpoint:
+    """Offset persistido do último termo contíguo já concluído"""
+
+    def __init__(self, path, source):
+        self.path = Path(path)
+        self.source = str(source)
+        self.offset = 0
+        self.completed = 0
+        self._pending = OrderedDict()
+        self._done = set()
+        self._unsaved = 0
+        if self.path.exists():
+            data = json.loads(self.path.read_text())
+            if data.get('source') == self.source:
+                self.offset = data.get('offset', 0)
+                self.completed = data.get('completed', 0)
+
+    def started(self, index, offset):
+        """Registra um termo em andamento (index na ordem de leitura)"""
+        self._pending[index] = offset
+
+    def done(self, index):
+        """Marca o termo como concluído e avança o offset até o primeiro ainda em andamento"""
+        self._done.add(index)
+        while self._pending and next(iter(self._pending)) in self._done:
+            first, self.offset = self._pending.popitem(last=False)
+            self._done.discard(first)
+            self.completed += 1
+        self._unsaved += 1
+        if self._unsaved >= SAVE_EVERY:
+            self.save()
+
+    def save(self):
+        """Grava o checkpoint de forma atômica"""
+        self._unsaved = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(self.path.name + '.tmp')
+        temporary.write_text(json.dumps({'source': self.source, 'offset': self.offset,
+                                         'completed': self.completed}))
+        os.replace(str(temporary), str(self.path))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Respostas falsas para os testes offline (sem rede)
+"""
+
+import sys
+import urllib.parse
+from pathlib import Path
+
+# Raiz do projeto no path, como nos demais scripts de tests/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+class FakeResponse:
+    """Resposta com a interface usada pelo scanner: status_code, headers, json() e text"""
+
+    def __init__(self, status_code=200, headers=None, data=None, text=''):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._data = data if data is not None else {}
+        self.text = text
+
+    def json(self):
+        return self._data
+
+def rate_headers(remaining, reset, limit=30):
+    """Headers X-RateLimit-* de uma resposta da busca"""
+    return {
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Reset': str(int(reset)),
+        'X-RateLimit-Limit': str(limit),
+    }
+
+def search_query(url):
+    """Query (parâmetro q) de uma URL da API de busca"""
+    return urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)['q'][0]
+
+class FakeTransport:
+    """Transporte que responde com respond(url) e guarda as URLs pedidas"""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.urls = []
+
+    def get(self, url, headers=None):
+        self.urls.append(url)
+        return self.respond(url)
+
+    def close(self):
+        pass
+
+def offline_config(**kwargs):
+    """ScanConfig sem caches em disco, para testes"""
+    from github_scan import ScanConfig
+    options = {'tokens': ['test-token'], 'http_cache_dir': '', 'result_cache_path': '',
+               'strategy_stats_path': '', 'query_denylist_path': ''}
+    options.update(kwargs)
+    return ScanConfig(**options)
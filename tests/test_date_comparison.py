@@ -3,19 +3,22 @@
 Script para comparar resultados com e sem filtro de data
 """
 
-import requests
 import os
+import sys
 from dotenv import load_dotenv
 import urllib.parse
 import time
+from pathlib import Path
+
+# Adiciona a raiz do projeto ao path para usar o transporte compartilhado
+sys.path.append(str(Path(__file__).parent.parent))
+
+from transport import create_transport
 
 load_dotenv()
 TOKEN = os.getenv('GITHUB_TOKEN')
 
-headers = {
-    'Authorization': f'token {TOKEN}',
-    'Accept': 'application/vnd.github.v3+json'
-}
+transport = create_transport(headers={'Authorization': f'token {TOKEN}'})
 
 def test_comparison(term):
     print(f"🧪 Comparando resultados para: {term}")
@@ -28,7 +31,7 @@ def test_comparison(term):
     print(f"\nSEM filtro de data:")
     print(f"Query: {query1}")
     
-    response1 = requests.get(url1, headers=headers)
+    response1 = transport.get(url1)
     if response1.status_code == 200:
         data1 = response1.json()
         total1 = data1.get('total_count', 0)
@@ -54,7 +57,7 @@ def test_comparison(term):
     print(f"\nCOM filtro de data (pushed 2020-2024):")
     print(f"Query: {query2}")
     
-    response2 = requests.get(url2, headers=headers)
+    response2 = transport.get(url2)
     if response2.status_code == 200:
         data2 = response2.json()
         total2 = data2.get('total_count', 0)
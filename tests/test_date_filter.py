@@ -3,18 +3,21 @@
 Script para testar diferentes filtros de data na API do GitHub
 """
 
-import requests
 import os
+import sys
 from dotenv import load_dotenv
 import urllib.parse
+from pathlib import Path
+
+# Adiciona a raiz do projeto ao path para usar o transporte compartilhado
+sys.path.append(str(Path(__file__).parent.parent))
+
+from transport import create_transport
 
 load_dotenv()
 TOKEN = os.getenv('GITHUB_TOKEN')
 
-headers = {
-    'Authorization': f'token {TOKEN}',
-    'Accept': 'application/vnd.github.v3+json'
-}
+transport = create_transport(headers={'Authorization': f'token {TOKEN}'})
 
 def test_date_filter(term, date_filter=None):
     """Testa diferentes filtros de data"""
@@ -30,7 +33,7 @@ def test_date_filter(term, date_filter=None):
     encoded_query = urllib.parse.quote(query)
     url = f'https://api.github.com/search/code?q={encoded_query}&per_page=5'
     
-    response = requests.get(url, headers=headers)
+    response = transport.get(url)
     
     if response.status_code == 200:
         data = response.json()
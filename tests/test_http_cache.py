@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Testes offline do cache HTTP (304, headers condicionais, LRU em memória e limpeza)
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import http_cache
+from fakes import FakeResponse
+from http_cache import CachedResponse, HTTPCache
+
+URL = 'https://api.github.com/search/code?q=foo&page=1'
+DATA = {'total_count': 1, 'items': [{'path': 'a'}]}
+
+def ok(etag='"v1"', last_modified=None):
+    headers = {}
+    if etag:
+        headers['ETag'] = etag
+    if last_modified:
+        headers['Last-Modified'] = last_modified
+    return FakeResponse(200, headers, DATA)
+
+class HTTPCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def cache(self, **kwargs):
+        return HTTPCache(self.directory.name, **kwargs)
+
+    def files(self):
+        return [name for name in os.listdir(self.directory.name) if name.endswith('.json')]
+
+    def test_conditional_headers(self):
+        cache = self.cache()
+        self.assertEqual(cache.conditional_headers(URL), {})
+        cache.resolve(URL, ok(etag='"v1"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT'))
+        self.assertEqual(cache.conditional_headers(URL), {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT',
+        })
+
+    def test_not_modified_resolves_to_stored_body(self):
+        self.cache().resolve(URL, ok())
+        cache = self.cache()  # Nova instância: lê do disco
+        response = cache.resolve(URL, FakeResponse(304, {'X-RateLimit-Remaining': '9'}))
+        self.assertIsInstance(response, CachedResponse)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), DATA)
+        self.assertEqual(response.headers['X-RateLimit-Remaining'], '9')
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_not_modified_without_entry_is_returned_as_is(self):
+        response = FakeResponse(304)
+        self.assertIs(self.cache().resolve(URL, response), response)
+
+    def test_response_without_validators_is_not_stored(self):
+        cache = self.cache()
+        cache.resolve(URL, ok(etag=None))
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(self.files(), [])
+        self.assertIsNone(cache.get(URL))
+
+    def test_memory_is_bounded(self):
+        cache = self.cache()
+        for i in range(http_cache.MEMORY_ENTRIES + 10):
+            cache.resolve(f'{URL}&n={i}', ok())
+        self.assertEqual(len(cache._memory), http_cache.MEMORY_ENTRIES)
+        self.assertNotIn(f'{URL}&n=0', cache._memory)
+        self.assertIsNotNone(cache.get(f'{URL}&n=0'))  # Continua no disco
+
+    def test_prune_by_age(self):
+        cache = self.cache()
+        cache.resolve(URL, ok())
+        cache.resolve(URL + '&n=1', ok())
+        old = time.time() - 3600
+        os.utime(cache._path(URL), (old, old))
+        self.cache(max_age=60)
+        self.assertEqual(self.files(), [cache._path(URL + '&n=1').name])
+
+    def test_prune_keeps_most_recently_used(self):
+        cache = self.cache()
+        now = time.time()
+        for i in range(5):
+            url = f'{URL}&n={i}'
+            cache.resolve(url, ok())
+            os.utime(cache._path(url), (now - 100 + i, now - 100 + i))
+        cache.resolve(f'{URL}&n=0', FakeResponse(304))  # Um 304 conta como uso recente
+        pruned = self.cache(max_entries=2)
+        self.assertEqual(pruned.pruned, 3)
+        self.assertEqual(sorted(self.files()),
+                         sorted([cache._path(f'{URL}&n=0').name, cache._path(f'{URL}&n=4').name]))
+
+    def test_prune_runs_during_stores(self):
+        with mock.patch.object(http_cache, 'PRUNE_EVERY', 3):
+            cache = self.cache(max_entries=2)
+            for i in range(3):
+                cache.resolve(f'{URL}&n={i}', ok())
+        self.assertEqual(len(self.files()), 2)
+        self.assertEqual(cache.pruned, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Testes offline do PagePlan, do PaginationCursor e do header Link
+"""
+
+import unittest
+
+from pagination import PagePlan, PaginationCursor, parse_link_header
+
+def items(count):
+    return [{'path': str(i)} for i in range(count)]
+
+class PagePlanTest(unittest.TestCase):
+
+    def test_adaptive_plan_uses_fewest_requests(self):
+        plan = PagePlan(5, 30)
+        self.assertEqual((plan.wanted, plan.max_requests, plan.per_page), (150, 2, 75))
+
+    def test_fixed_plan_keeps_per_page(self):
+        plan = PagePlan(5, 30, adaptive=False)
+        self.assertEqual((plan.wanted, plan.max_requests, plan.per_page), (150, 5, 30))
+
+    def test_plan_is_capped_at_1000_results(self):
+        plan = PagePlan(34, 100)
+        self.assertEqual((plan.wanted, plan.max_requests, plan.per_page), (1000, 10, 100))
+
+    def test_pages_for_total_count(self):
+        plan = PagePlan(5, 30)
+        self.assertEqual(plan.pages_for(0), 0)
+        self.assertEqual(plan.pages_for(75), 1)
+        self.assertEqual(plan.pages_for(80), 2)
+        self.assertEqual(plan.pages_for(5000), 2)
+
+class PaginationCursorTest(unittest.TestCase):
+
+    def test_start_fixes_the_winning_strategy(self):
+        cursor = PaginationCursor('t', ['q0', 'q1'], PagePlan(5, 30))
+        page = cursor.start(1, items(75), 500, 'next-url')
+        self.assertEqual(cursor.query, 'q1')
+        self.assertEqual(len(page), 75)
+        self.assertEqual(cursor.max_pages, 2)
+        self.assertFalse(cursor.exhausted)
+
+    def test_exhausted_without_next_link(self):
+        cursor = PaginationCursor('t', ['q0'], PagePlan(5, 30))
+        cursor.start(0, items(75), 500, None)
+        self.assertTrue(cursor.exhausted)
+
+    def test_exhausted_at_planned_pages_and_trimmed_to_wanted(self):
+        cursor = PaginationCursor('t', ['q0'], PagePlan(1, 30, adaptive=False))
+        page = cursor.start(0, items(40), 500, 'next-url')
+        self.assertEqual(len(page), 30)
+        self.assertTrue(cursor.exhausted)
+
+    def test_advance_counts_pages(self):
+        cursor = PaginationCursor('t', ['q0'], PagePlan(5, 30))
+        cursor.start(0, items(75), 150, 'next-url')
+        cursor.advance(items(75), 150, None)
+        self.assertEqual((cursor.page, cursor.fetched), (2, 150))
+        self.assertTrue(cursor.exhausted)
+
+    def test_parse_link_header(self):
+        header = ('<https://api.github.com/search/code?q=x&page=2>; rel="next", '
+                  '<https://api.github.com/search/code?q=x&page=5>; rel="last"')
+        links = parse_link_header(header)
+        self.assertTrue(links['next'].endswith('page=2'))
+        self.assertTrue(links['last'].endswith('page=5'))
+        self.assertEqual(parse_link_header(None), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Testes offline do particionamento por size:/extension: contra um índice simulado
+"""
+
+import asyncio
+import contextlib
+import io
+import re
+import unittest
+
+import fakes  # noqa: F401  (raiz do projeto no path)
+from pagination import SEARCH_RESULT_CAP
+from partition import COMMON_EXTENSIONS, QueryPartitioner, merge_unique
+
+_SIZE_RE = re.compile(r'size:(\d+)\.\.(\d+)')
+_EXTENSION_RE = re.compile(r'extension:(\S+)')
+
+class FakeIndex:
+    """Busca simulada: filtra os arquivos por size:/extension: e pagina respeitando o limite de 1000"""
+
+    def __init__(self, files):
+        self.files = files
+        self.requests = 0
+
+    async def fetch(self, query, page, per_page):
+        self.requests += 1
+        matches = self.files
+        size = _SIZE_RE.search(query)
+        if size:
+            low, high = int(size.group(1)), int(size.group(2))
+            matches = [f for f in matches if low <= f['size'] <= high]
+        extension = _EXTENSION_RE.search(query)
+        if extension:
+            matches = [f for f in matches if f['extension'] == extension.group(1)]
+        visible = matches[:SEARCH_RESULT_CAP]
+        items = visible[(page - 1) * per_page:page * per_page]
+        return 200, [{'html_url': f['url']} for f in items], len(matches), None
+
+def files(count, size=None, extension='py', start=0):
+    return [{'url': f'https://x/{start + i}', 'size': size if size is not None else (start + i) * 37,
+             'extension': extension} for i in range(count)]
+
+def enumerate_all(index, total_count, max_requests=500):
+    partitioner = QueryPartitioner(index.fetch, max_requests)
+    with contextlib.redirect_stdout(io.StringIO()):
+        items = asyncio.run(partitioner.enumerate('secret in:file', total_count))
+    return partitioner, items
+
+class QueryPartitionerTest(unittest.TestCase):
+
+    def test_size_ranges_enumerate_past_the_cap(self):
+        index = FakeIndex(files(2500))
+        partitioner, items = enumerate_all(index, 2500)
+        self.assertEqual(len(items), 2500)
+        self.assertEqual(len({item['html_url'] for item in items}), 2500)
+        self.assertFalse(partitioner.truncated)
+        self.assertGreater(partitioner.shards, 2)
+        self.assertEqual(partitioner.budget.used, index.requests)
+
+    def test_budget_limits_requests_and_truncates(self):
+        index = FakeIndex(files(2500))
+        partitioner, items = enumerate_all(index, 2500, max_requests=5)
+        self.assertLessEqual(index.requests, 5)
+        self.assertTrue(partitioner.truncated)
+        self.assertTrue(partitioner.budget_exhausted)
+        self.assertLess(len(items), 2500)
+
+    def test_single_size_is_split_by_extension(self):
+        corpus = files(800, size=10, extension='py') + files(700, size=10, extension='js', start=800)
+        partitioner, items = enumerate_all(FakeIndex(corpus), 1500)
+        self.assertEqual(len(items), 1500)
+        self.assertFalse(partitioner.truncated)
+
+    def test_uncommon_extensions_are_reported_as_unreachable(self):
+        self.assertNotIn('lock', COMMON_EXTENSIONS)
+        corpus = files(900, size=10, extension='py') + files(300, size=10, extension='lock', start=900)
+        partitioner, items = enumerate_all(FakeIndex(corpus), 1200)
+        self.assertEqual(len(items), 900)
+        self.assertTrue(partitioner.truncated)
+        self.assertFalse(partitioner.budget_exhausted)
+        self.assertEqual(partitioner.unreachable, 300)
+
+    def test_extension_over_the_cap_is_reported(self):
+        corpus = files(1200, size=10, extension='py')
+        partitioner, items = enumerate_all(FakeIndex(corpus), 1200)
+        self.assertEqual(len(items), SEARCH_RESULT_CAP)
+        self.assertEqual(partitioner.unreachable, 200)
+
+    def test_can_partition(self):
+        self.assertTrue(QueryPartitioner.can_partition('secret in:file'))
+        self.assertFalse(QueryPartitioner.can_partition('secret size:1..2 in:file'))
+        self.assertFalse(QueryPartitioner.can_partition('secret Extension:py'))
+
+    def test_merge_unique_keeps_first_occurrence(self):
+        first = [{'html_url': 'a'}, {'html_url': 'b'}]
+        second = [{'html_url': 'b'}, {'html_url': 'c'}]
+        self.assertEqual([item['html_url'] for item in merge_unique(first, second)], ['a', 'b', 'c'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Testes offline do plano global de queries: deduplicação e entrega a todos os termos
+"""
+
+import contextlib
+import io
+import time
+import unittest
+
+from fakes import FakeResponse, FakeTransport, offline_config, rate_headers, search_query
+from github_scan import Scanner
+from query_planner import QueryPlan, canonical_query
+
+def expand(term):
+    return [f'"{term}" in:file', f'{term} in:file', f'{term} config in:file']
+
+class QueryPlanTest(unittest.TestCase):
+
+    def test_equivalent_queries_are_planned_once(self):
+        plan = QueryPlan.build(['foo', 'FOO', 'bar', 'foo'], expand)
+        self.assertEqual(plan.generated, 9)
+        # "foo" e foo são equivalentes dentro do termo; FOO gera as mesmas queries de foo
+        self.assertEqual(len(plan.queries), 4)
+        self.assertEqual(plan.queries_for('FOO'), plan.queries_for('foo'))
+        self.assertEqual(plan.queries_for('foo'), ['"foo" in:file', 'foo config in:file'])
+
+    def test_owners_fan_back_to_every_term(self):
+        plan = QueryPlan.build(['foo', 'FOO', 'bar'], expand)
+        shared = plan.shared_queries()
+        self.assertEqual(shared['"foo" in:file'], ['foo', 'FOO'])
+        self.assertNotIn('"bar" in:file', shared)
+        self.assertEqual(plan.owners[canonical_query('"bar" in:file')], ['bar'])
+
+    def test_unknown_term_has_no_queries(self):
+        self.assertEqual(QueryPlan.build([], expand).queries_for('x'), [])
+
+class SharedFetchTest(unittest.TestCase):
+
+    def test_shared_query_is_sent_once_and_delivered_to_both_terms(self):
+        reset = time.time() + 60
+
+        def respond(url):
+            item = {'html_url': f'https://x/{search_query(url)}', 'repository': {'full_name': 'r/x'}, 'path': 'p'}
+            return FakeResponse(200, rate_headers(29, reset), {'total_count': 1, 'items': [item]})
+
+        transport = FakeTransport(respond)
+        scanner = Scanner(offline_config(), transport=transport)
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = scanner.scan(['foo', 'FOO'], pages=1)
+        scanner.close()
+        self.assertEqual(len(transport.urls), 1)
+        self.assertEqual(results['foo'], results['FOO'])
+        self.assertEqual(len(results['foo'][0]), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Testes offline da validação, equivalência e denylist de queries
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import fakes  # noqa: F401  (raiz do projeto no path)
+from query_validator import QueryDenylist, equivalence_key, invalid_reason, prune_queries, rewrite_query
+
+class QueryValidatorTest(unittest.TestCase):
+
+    def test_rewrite_pseudo_qualifiers(self):
+        self.assertEqual(rewrite_query('token:"x" in:file'), 'token "x" in:file')
+        self.assertEqual(rewrite_query('foo size:10..20 in:file'), 'foo size:10..20 in:file')
+
+    def test_invalid_reason(self):
+        self.assertEqual(invalid_reason('"a in:file'), 'aspas desbalanceadas')
+        self.assertEqual(invalid_reason('in:file'), 'sem texto buscável')
+        self.assertIsNotNone(invalid_reason('a' * 300))
+        self.assertIsNone(invalid_reason('"a" in:file'))
+
+    def test_equivalence_key(self):
+        self.assertEqual(equivalence_key('foo bar in:file'), equivalence_key('bar  foo in:FILE'))
+        self.assertEqual(equivalence_key('"foo"'), equivalence_key('foo'))
+        self.assertNotEqual(equivalence_key('"foo bar"'), equivalence_key('foo bar'))
+        self.assertNotEqual(equivalence_key('"foo.bar"'), equivalence_key('foo.bar'))
+
+    def test_prune_drops_equivalent_strategies(self):
+        kept, dropped = prune_queries('foo', ['"foo" in:file', 'foo in:file'])
+        self.assertEqual(kept, ['"foo" in:file'])
+        self.assertEqual(dropped, [('foo in:file', 'equivalente a uma estratégia anterior')])
+
+    def test_prune_keeps_broader_unquoted_strategy(self):
+        kept, _ = prune_queries('foo bar', ['"foo bar" in:file', 'foo bar in:file'])
+        self.assertEqual(kept, ['"foo bar" in:file', 'foo bar in:file'])
+
+    def test_denylist_persists_invalid_queries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'denylist.sqlite3'
+            denylist = QueryDenylist(path)
+            denylist.record('foo in:file', 422)
+            denylist.close()
+            denylist = QueryDenylist(path)
+            self.assertTrue(denylist.denies('FOO  in:file'))
+            self.assertFalse(denylist.denies('bar in:file'))
+            denylist.close()
+
+    def test_denylist_denies_strategy_only_without_successes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            denylist = QueryDenylist(Path(directory) / 'denylist.sqlite3')
+            for term in ('a', 'b', 'c'):
+                denylist.record(f'x:{term} in:file', 422, 'x:{term} in:file')
+            self.assertTrue(denylist.denies('x:d in:file', 'x:{term} in:file'))
+            denylist.record('y:a in:file', 200, 'y:{term} in:file')
+            for term in ('b', 'c', 'd'):
+                denylist.record(f'y:{term} in:file', 422, 'y:{term} in:file')
+            self.assertFalse(denylist.denies('y:e in:file', 'y:{term} in:file'))
+            denylist.close()
+
+if __name__ == '__main__':
+    unittest.main()
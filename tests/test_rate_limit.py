@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Testes offline do RateLimitScheduler (headers X-RateLimit-* e Retry-After)
+"""
+
+import time
+import unittest
+
+from fakes import FakeResponse, rate_headers
+from rate_limit import RESET_MARGIN, RateLimitScheduler, _int_header
+
+class RateLimitSchedulerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = int(time.time())
+        self.scheduler = RateLimitScheduler(fallback_wait=2)
+
+    def test_update_reads_quota_and_reset(self):
+        retry = self.scheduler.update(FakeResponse(headers=rate_headers(29, self.now + 60)))
+        self.assertFalse(retry)
+        self.assertEqual(self.scheduler.remaining, 29)
+        self.assertEqual(self.scheduler.reset_at, self.now + 60 + RESET_MARGIN)
+        self.assertEqual(self.scheduler.limit, 30)
+
+    def test_out_of_order_responses_keep_lowest_quota(self):
+        self.scheduler.update(FakeResponse(headers=rate_headers(20, self.now + 60)))
+        self.scheduler.update(FakeResponse(headers=rate_headers(25, self.now + 60)))
+        self.assertEqual(self.scheduler.remaining, 20)
+
+    def test_new_window_replaces_quota(self):
+        self.scheduler.update(FakeResponse(headers=rate_headers(0, self.now - 1)))
+        self.scheduler.update(FakeResponse(headers=rate_headers(29, self.now + 60)))
+        self.assertEqual(self.scheduler.remaining, 29)
+
+    def test_stale_window_is_ignored(self):
+        self.scheduler.update(FakeResponse(headers=rate_headers(29, self.now + 60)))
+        self.scheduler.update(FakeResponse(headers=rate_headers(0, self.now - 1)))
+        self.assertEqual(self.scheduler.remaining, 29)
+        self.assertEqual(self.scheduler.wait_time(), 0.0)
+
+    def test_stale_rate_limited_response_is_retried_without_blocking(self):
+        self.scheduler.update(FakeResponse(headers=rate_headers(29, self.now + 60)))
+        retry = self.scheduler.update(FakeResponse(403, rate_headers(0, self.now - 1)))
+        self.assertTrue(retry)
+        self.assertEqual(self.scheduler.remaining, 29)
+
+    def test_exhausted_quota_waits_until_reset(self):
+        retry = self.scheduler.update(FakeResponse(403, rate_headers(0, self.now + 30)))
+        self.assertTrue(retry)
+        self.assertAlmostEqual(self.scheduler.wait_time(), 30 + RESET_MARGIN, delta=1.5)
+        self.assertGreater(self.scheduler.try_acquire(), 0)
+
+    def test_try_acquire_reserves_quota(self):
+        self.scheduler.update(FakeResponse(headers=rate_headers(2, self.now + 60)))
+        self.assertEqual(self.scheduler.try_acquire(), 0.0)
+        self.assertEqual(self.scheduler.try_acquire(), 0.0)
+        self.assertEqual(self.scheduler.remaining, 0)
+        self.assertGreater(self.scheduler.try_acquire(), 0)
+
+    def test_not_modified_refunds_quota(self):
+        self.scheduler.update(FakeResponse(headers=rate_headers(10, self.now + 60)))
+        self.scheduler.try_acquire()
+        self.scheduler.update(FakeResponse(304))
+        self.assertEqual(self.scheduler.remaining, 10)
+
+    def test_retry_after_blocks(self):
+        retry = self.scheduler.update(FakeResponse(403, {'Retry-After': '5'}))
+        self.assertTrue(retry)
+        self.assertAlmostEqual(self.scheduler.wait_time(), 5, delta=0.5)
+
+    def test_secondary_limit_without_headers_uses_fallback(self):
+        retry = self.scheduler.update(FakeResponse(403, text='You have exceeded a secondary rate limit'))
+        self.assertTrue(retry)
+        self.assertAlmostEqual(self.scheduler.wait_time(), 2, delta=0.5)
+
+    def test_permission_error_is_not_retried(self):
+        self.assertFalse(self.scheduler.update(FakeResponse(403, text='Resource not accessible')))
+        self.assertEqual(self.scheduler.wait_time(), 0.0)
+
+    def test_unknown_quota_headroom_is_the_limit(self):
+        self.assertEqual(self.scheduler.headroom(), 30)
+        self.scheduler.update(FakeResponse(headers=rate_headers(7, self.now + 60, limit=10)))
+        self.assertEqual(self.scheduler.headroom(), 7)
+
+    def test_int_header(self):
+        self.assertEqual(_int_header({'A': '12'}, 'A'), 12)
+        self.assertEqual(_int_header({'A': '1.5'}, 'A'), 1)
+        self.assertIsNone(_int_header({'A': 'x'}, 'A'))
+        self.assertIsNone(_int_header({}, 'A'))
+
+if __name__ == '__main__':
+    unittest.main()
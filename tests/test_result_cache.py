@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Testes offline do cache de resultados (normalização, TTL, LRU e escopo por token)
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import fakes  # noqa: F401  (raiz do projeto no path)
+from result_cache import ResultCache, normalize_query, token_scope
+
+ITEMS = [{'path': 'a'}]
+
+class ResultCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'results.sqlite3'
+        self.caches = []
+
+    def tearDown(self):
+        for cache in self.caches:
+            cache.close()
+        self.directory.cleanup()
+
+    def cache(self, **kwargs):
+        cache = ResultCache(self.path, **kwargs)
+        self.caches.append(cache)
+        return cache
+
+    def test_normalize_query(self):
+        self.assertEqual(normalize_query('in:file  Foo "Bar"'), normalize_query('foo "bar" IN:FILE'))
+        self.assertEqual(normalize_query('a size:1 in:file'), 'a in:file size:1')
+
+    def test_put_and_get_by_normalized_query(self):
+        cache = self.cache()
+        cache.put('Foo in:file', 1, 30, 200, ITEMS, 1)
+        self.assertEqual(cache.get('foo  IN:file', 1, 30), (200, ITEMS, 1))
+        self.assertIsNone(cache.get('foo in:file', 2, 30))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_ttl_by_result_kind(self):
+        cache = self.cache(ttl=100, empty_ttl=10, invalid_ttl=10)
+        with mock.patch('result_cache.time.time', return_value=1000.0):
+            cache.put('full', 1, 30, 200, ITEMS, 1)
+            cache.put('empty', 1, 30, 200, [], 0)
+            cache.put('invalid', 1, 30, 422, [], 0)
+            cache.put('limited', 1, 30, 403, [], 0)
+        with mock.patch('result_cache.time.time', return_value=1050.0):
+            self.assertIsNotNone(cache.get('full', 1, 30))
+            self.assertIsNone(cache.get('empty', 1, 30))
+            self.assertIsNone(cache.get('invalid', 1, 30))
+            self.assertIsNone(cache.get('limited', 1, 30))
+        self.assertEqual(cache.expired, 2)
+
+    def test_lru_eviction(self):
+        cache = self.cache(max_entries=2)
+        with mock.patch('result_cache.time.time', return_value=1000.0):
+            cache.put('a', 1, 30, 200, ITEMS, 1)
+        with mock.patch('result_cache.time.time', return_value=1001.0):
+            cache.put('b', 1, 30, 200, ITEMS, 1)
+        with mock.patch('result_cache.time.time', return_value=1002.0):
+            cache.get('a', 1, 30)
+        with mock.patch('result_cache.time.time', return_value=1003.0):
+            cache.put('c', 1, 30, 200, ITEMS, 1)
+            self.assertIsNotNone(cache.get('a', 1, 30))
+            self.assertIsNone(cache.get('b', 1, 30))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_scopes_are_isolated(self):
+        first = self.cache(scope=token_scope(['token-a']))
+        second = self.cache(scope=token_scope(['token-b']))
+        first.put('q', 1, 30, 200, ITEMS, 1)
+        self.assertIsNone(second.get('q', 1, 30))
+        self.assertEqual(token_scope(['a', 'b']), token_scope(['b', 'a', 'a']))
+        self.assertNotIn('token-a', token_scope(['token-a']))
+
+    def test_unscoped_schema_is_dropped(self):
+        conn = sqlite3.connect(str(self.path))
+        conn.execute("CREATE TABLE results (query TEXT, page INTEGER, per_page INTEGER, status INTEGER, "
+                     "total_count INTEGER, items TEXT, expires_at REAL, last_access REAL)")
+        conn.execute("INSERT INTO results VALUES ('q', 1, 30, 200, 1, '[]', 9e12, 0)")
+        conn.commit()
+        conn.close()
+        cache = self.cache()
+        self.assertIsNone(cache.get('q', 1, 30))
+        cache.put('q', 1, 30, 200, ITEMS, 1)
+        self.assertEqual(cache.get('q', 1, 30), (200, ITEMS, 1))
+
+if __name__ == '__main__':
+    unittest.main()
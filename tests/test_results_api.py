@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Testes offline da API de resultados: query string, gzip e paginação por seq dos jobs
+"""
+
+import unittest
+
+import fakes  # noqa: F401  (raiz do projeto no path)
+from scan_jobs import ScanJob
+from server import RESULTS_PAGE_MAX, accepts_gzip, parse_results_query
+
+def result(term, path):
+    return {'type': 'result', 'term': term, 'data_type': 'generic', 'page': 1,
+            'repository': 'r/x', 'path': path, 'url': f'https://x/{path}', 'sha': '1'}
+
+class ParseResultsQueryTest(unittest.TestCase):
+
+    def test_defaults(self):
+        self.assertEqual(parse_results_query('/api/results'), (0, None, None))
+
+    def test_cursor_wins_over_since(self):
+        self.assertEqual(parse_results_query('/api/results?since=3&cursor=7')[0], 7)
+        self.assertEqual(parse_results_query('/api/results?since=3')[0], 3)
+
+    def test_limit_is_capped(self):
+        self.assertEqual(parse_results_query('/api/results?limit=10')[1], 10)
+        self.assertEqual(parse_results_query('/api/results?limit=999999')[1], RESULTS_PAGE_MAX)
+
+    def test_fields_always_include_seq(self):
+        self.assertEqual(parse_results_query('/api/results?fields=path,url')[2], ['seq', 'path', 'url'])
+
+    def test_invalid_values(self):
+        for query in ('limit=0', 'limit=-1', 'since=-1', 'cursor=abc', 'fields=nope'):
+            with self.assertRaises(ValueError):
+                parse_results_query(f'/api/results?{query}')
+
+class AcceptsGzipTest(unittest.TestCase):
+
+    def test_accept_encoding(self):
+        self.assertTrue(accepts_gzip('gzip, deflate, br'))
+        self.assertTrue(accepts_gzip('br;q=1.0, gzip;q=0.8'))
+        self.assertTrue(accepts_gzip('*'))
+        self.assertFalse(accepts_gzip('gzip;q=0'))
+        self.assertFalse(accepts_gzip('deflate'))
+        self.assertFalse(accepts_gzip(''))
+
+class ScanJobResultsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.job = ScanJob({'GITHUB_TOKEN': 'x', 'SEARCH_TERM': 'a,b'})
+        self.job.set_status('running', 'Scanner em execução...')
+        for index in range(5):
+            self.job.add_event(result('a', str(index)))
+        self.job.add_event({'type': 'term', 'term': 'a', 'data_type': 'generic', 'results': 5, 'pages': 1})
+
+    def test_events_are_numbered(self):
+        self.assertEqual([event['seq'] for event in self.job.events], list(range(1, 9)))
+        self.assertEqual(self.job.terms_done, 1)
+
+    def test_repeated_terms_are_counted_once(self):
+        self.assertEqual(ScanJob({'GITHUB_TOKEN': 'x', 'SEARCH_TERM': 'a,b,a'}).terms_total, 2)
+
+    def test_cursor_pagination_covers_every_result_once(self):
+        seen = []
+        cursor = 0
+        while True:
+            page = self.job.results_snapshot(cursor, 2)
+            seen += [item['path'] for item in page['results']]
+            cursor = page['next_cursor']
+            if not page['has_more']:
+                break
+        self.assertEqual(seen, ['0', '1', '2', '3', '4'])
+        self.assertEqual(cursor, self.job.last_seq)
+
+    def test_since_returns_only_new_results(self):
+        cursor = self.job.results_snapshot()['next_cursor']
+        self.assertEqual(self.job.results_snapshot(cursor)['results'], [])
+        self.job.add_event(result('b', 'new'))
+        self.assertEqual([item['path'] for item in self.job.results_snapshot(cursor)['results']], ['new'])
+
+    def test_wait_events_returns_after_seq(self):
+        events, finished = self.job.wait_events(6, timeout=0)
+        self.assertEqual([event['seq'] for event in events], [7, 8])
+        self.assertFalse(finished)
+        self.job.set_status('completed', 'ok')
+        events, finished = self.job.wait_events(self.job.last_seq, timeout=0)
+        self.assertEqual((events, finished), ([], True))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Testes offline do histórico por estratégia: reordenação e descarte
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import fakes  # noqa: F401  (raiz do projeto no path)
+from strategy_stats import DROP_AFTER, MIN_SAMPLES, StrategyStats, strategy_key
+
+QUERIES = ['"t" in:file', 't in:file', 'token:"t" in:file', 'key:"t" in:file']
+
+class StrategyStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'stats.sqlite3'
+        self.stats = StrategyStats(self.path)
+
+    def tearDown(self):
+        self.stats.close()
+        self.directory.cleanup()
+
+    def record(self, query, requests, hits, data_type='api_key', term='t'):
+        strategy = strategy_key(term, query)
+        for index in range(requests):
+            self.stats.record(data_type, strategy, 200, 1 if index < hits else 0, 0.1)
+
+    def test_strategy_key_replaces_term_parts(self):
+        self.assertEqual(strategy_key('abc', 'token:"abc" in:file'), 'token:"{term}" in:file')
+        self.assertEqual(strategy_key('a@b.com', '"b.com" in:file'), '"{domain}" in:file')
+        self.assertEqual(strategy_key('https://x.io', '"x.io" in:file'), '"{clean_url}" in:file')
+        self.assertEqual(strategy_key('abc', '"abc" in:file created:>2024-01-01', 'created:>2024-01-01'),
+                         '"{term}" in:file')
+
+    def test_without_history_order_is_unchanged(self):
+        self.assertEqual(self.stats.order('t', 'api_key', QUERIES), QUERIES)
+
+    def test_few_samples_keep_original_position(self):
+        self.record('key:"t" in:file', MIN_SAMPLES - 1, MIN_SAMPLES - 1)
+        self.assertEqual(self.stats.order('t', 'api_key', QUERIES), QUERIES)
+
+    def test_learned_strategies_are_sorted_by_hit_rate_in_their_slots(self):
+        self.record('"t" in:file', MIN_SAMPLES, 2)
+        self.record('key:"t" in:file', MIN_SAMPLES, 8)
+        ordered = self.stats.order('t', 'api_key', QUERIES)
+        # As duas com histórico trocam de lugar; as sem histórico continuam onde estavam
+        self.assertEqual(ordered, ['key:"t" in:file', 't in:file', 'token:"t" in:file', '"t" in:file'])
+
+    def test_history_applies_to_other_terms_of_the_same_type(self):
+        self.record('key:"t" in:file', MIN_SAMPLES, 9)
+        self.record('"t" in:file', MIN_SAMPLES, 1)
+        queries = [query.replace('t', 'zz') for query in QUERIES]
+        self.assertEqual(self.stats.order('zz', 'api_key', queries)[0], 'key:"zz" in:file')
+        self.assertEqual(self.stats.order('zz', 'password', queries), queries)
+
+    def test_strategies_without_hits_are_dropped(self):
+        self.record('token:"t" in:file', DROP_AFTER, 0)
+        self.assertNotIn('token:"t" in:file', self.stats.order('t', 'api_key', QUERIES))
+        self.record('key:"t" in:file', DROP_AFTER - 1, 0)
+        self.assertIn('key:"t" in:file', self.stats.order('t', 'api_key', QUERIES))
+
+    def test_main_strategy_kept_when_all_dropped(self):
+        for query in QUERIES:
+            self.record(query, DROP_AFTER, 0)
+        self.assertEqual(self.stats.order('t', 'api_key', QUERIES), QUERIES[:1])
+
+    def test_history_persists(self):
+        self.record('key:"t" in:file', MIN_SAMPLES, 9)
+        self.stats.close()
+        self.stats = StrategyStats(self.path)
+        (row,) = self.stats.rows('api_key')
+        self.assertEqual(row[1:4], ('key:"{term}" in:file', MIN_SAMPLES, 9))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Testes offline da leitura de termos em streaming e do checkpoint por offset
+"""
+
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+import fakes  # noqa: F401  (raiz do projeto no path)
+from term_source import Checkpoint, iter_terms
+
+CONTENT = b'alpha\n\n# comentario\nbeta\ngamma\n'
+
+class IterTermsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'terms.txt'
+        self.path.write_bytes(CONTENT)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_skips_blank_lines_and_comments_with_end_offsets(self):
+        self.assertEqual(list(iter_terms(str(self.path))), [('alpha', 6), ('beta', 25), ('gamma', 31)])
+
+    def test_resumes_from_offset(self):
+        self.assertEqual([term for term, _ in iter_terms(str(self.path), 6)], ['beta', 'gamma'])
+
+    def test_gzip_offsets_match_plain_text(self):
+        compressed = Path(self.directory.name) / 'terms.txt.gz'
+        compressed.write_bytes(gzip.compress(CONTENT))
+        self.assertEqual(list(iter_terms(str(compressed))), list(iter_terms(str(self.path))))
+        self.assertEqual([term for term, _ in iter_terms(str(compressed), 25)], ['gamma'])
+
+class CheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'terms.checkpoint'
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_offset_advances_only_over_contiguous_done_terms(self):
+        checkpoint = Checkpoint(self.path, 'terms.txt')
+        for index, offset in enumerate((6, 25, 31)):
+            checkpoint.started(index, offset)
+        checkpoint.done(1)
+        self.assertEqual((checkpoint.offset, checkpoint.completed), (0, 0))
+        checkpoint.done(0)
+        self.assertEqual((checkpoint.offset, checkpoint.completed), (25, 2))
+        checkpoint.done(2)
+        self.assertEqual((checkpoint.offset, checkpoint.completed), (31, 3))
+
+    def test_save_and_reload(self):
+        checkpoint = Checkpoint(self.path, 'terms.txt')
+        checkpoint.started(0, 6)
+        checkpoint.done(0)
+        checkpoint.save()
+        reloaded = Checkpoint(self.path, 'terms.txt')
+        self.assertEqual((reloaded.offset, reloaded.completed), (6, 1))
+
+    def test_checkpoint_of_another_source_is_ignored(self):
+        checkpoint = Checkpoint(self.path, 'terms.txt')
+        checkpoint.started(0, 6)
+        checkpoint.done(0)
+        checkpoint.save()
+        self.assertEqual(Checkpoint(self.path, 'other.txt').offset, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Testes offline do TokenPool (quota por token, rotação e revogação)
+"""
+
+import contextlib
+import io
+import time
+import unittest
+
+from fakes import FakeResponse, FakeTransport, offline_config, rate_headers
+from github_scan import Scanner
+from token_pool import TokenPool, TokensRevoked
+
+class TokenPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.reset = int(time.time()) + 60
+
+    def test_requires_a_token_and_deduplicates(self):
+        with self.assertRaises(ValueError):
+            TokenPool(['', None])
+        self.assertEqual(len(TokenPool(['a', 'b', 'a'])), 2)
+
+    def test_acquire_prefers_most_headroom(self):
+        pool = TokenPool(['aaaa', 'bbbb'])
+        pool.schedulers['aaaa'].update(FakeResponse(headers=rate_headers(3, self.reset)))
+        pool.schedulers['bbbb'].update(FakeResponse(headers=rate_headers(20, self.reset)))
+        self.assertEqual(pool.acquire(), 'bbbb')
+
+    def test_revoked_token_is_dropped_and_request_rotates(self):
+        pool = TokenPool(['aaaa', 'bbbb'])
+        sent = []
+
+        def send(token):
+            sent.append(token)
+            return FakeResponse(401 if token == 'aaaa' else 200, rate_headers(25, self.reset))
+
+        response = pool.request(send)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('aaaa', sent)
+        self.assertEqual(pool.active_tokens(), ['bbbb'])
+        self.assertEqual(pool.summary()['...aaaa'], 'revogado')
+
+    def test_all_tokens_revoked_returns_401(self):
+        pool = TokenPool(['aaaa'])
+        response = pool.request(lambda token: FakeResponse(401))
+        self.assertEqual(response.status_code, 401)
+        with self.assertRaises(TokensRevoked):
+            pool.acquire()
+
+    def test_scan_stops_with_error_status_when_all_tokens_are_revoked(self):
+        config = offline_config(tokens=['aaaa', 'bbbb'], search_terms=['foo', 'bar', 'baz'])
+        scanner = Scanner(config, transport=FakeTransport(lambda url: FakeResponse(401)))
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = scanner.run()
+        scanner.close()
+        self.assertEqual(status, 1)
+        self.assertIn('revogados', output.getvalue())
+
+    def test_rate_limited_token_rotates_to_the_next(self):
+        pool = TokenPool(['aaaa', 'bbbb'])
+        sent = []
+
+        def send(token):
+            sent.append(token)
+            if len(sent) == 1:
+                return FakeResponse(403, {'Retry-After': '60'})
+            return FakeResponse(200, rate_headers(29, self.reset))
+
+        response = pool.request(send)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(set(sent)), 2)
+
+    def test_remaining_sums_active_tokens(self):
+        pool = TokenPool(['aaaa', 'bbbb'])
+        pool.schedulers['aaaa'].update(FakeResponse(headers=rate_headers(5, self.reset)))
+        pool.schedulers['bbbb'].update(FakeResponse(headers=rate_headers(7, self.reset)))
+        self.assertEqual(pool.remaining(), 12)
+        pool.revoke('aaaa')
+        self.assertEqual(pool.remaining(), 7)
+
+if __name__ == '__main__':
+    unittest.main()
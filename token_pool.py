@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Pool de tokens do GitHub com contabilidade de quota por token e rotação automática
+"""
+
+import threading
+import time
+
+from rate_limit import RateLimitScheduler
+
+class TokensRevoked(RuntimeError):
+    """Nenhum token do pool continua válido"""
+
+class TokenPool:
+    """Distribui requisições para o token com mais quota livre"""
+
+    def __init__(self, tokens, fallback_wait=2, max_retries=5):
+        unique = list(dict.fromkeys(t for t in tokens if t))
+        if not unique:
+            raise ValueError("Nenhum token do GitHub informado")
+        self.schedulers = {token: RateLimitScheduler(fallback_wait) for token in unique}
+        self.revoked = set()
+        self.max_retries = max_retries
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.schedulers) - len(self.revoked)
+
+    def active_tokens(self):
+        return [t for t in self.schedulers if t not in self.revoked]
+
+    def acquire(self):
+        """Reserva uma requisição no token com mais headroom, aguardando se todos esgotaram"""
+        while True:
+            with self._lock:
+                active = self.active_tokens()
+                if not active:
+                    raise TokensRevoked("Todos os tokens do GitHub foram revogados ou são inválidos")
+                ranked = sorted(active, key=lambda t: self.schedulers[t].headroom(), reverse=True)
+                waits = []
+                for token in ranked:
+                    wait = self.schedulers[token].try_acquire()
+                    if wait <= 0:
+                        return token
+                    waits.append(wait)
+            wait = min(waits)
+            print(f"⏳ Todos os {len(active)} token(s) sem quota. Aguardando {wait:.1f}s até o próximo reset...")
+            time.sleep(wait)
+
+    def revoke(self, token):
+        """Retira do pool um token inválido ou revogado"""
+        with self._lock:
+            if token not in self.revoked:
+                self.revoked.add(token)
+                print(f"🔑 Token ...{token[-4:]} rejeitado (401). Removido do pool, {len(self)} restante(s)")
+
+    def request(self, send):
+        """Executa send(token) rotacionando tokens em 401 e em respostas limitadas"""
+        for attempt in range(self.max_retries + 1):
+            token = self.acquire()
+            response = send(token)
+            if response.status_code == 401:
+                self.revoke(token)
+                if not self.active_tokens():
+                    return response
+                continue
+            if not self.schedulers[token].update(response) or attempt == self.max_retries:
+                return response
+            print(f"⚠️  Rate limit no token ...{token[-4:]}. Rotacionando ({attempt + 1}/{self.max_retries})...")
+        return response
+
+    def remaining(self):
+        """Quota restante somada dos tokens ativos"""
+        with self._lock:
+            return sum(self.schedulers[token].headroom() for token in self.active_tokens())
+
+    def summary(self):
+        """Quota restante conhecida de cada token (mascarado)"""
+        return {
+            f'...{token[-4:]}': 'revogado' if token in self.revoked else scheduler.headroom()
+            for token, scheduler in self.schedulers.items()
+        }
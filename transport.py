@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Camada de transporte HTTP compartilhada pelo scanner, pelos testes e pelos bridges
+
+- RequestsTransport: sessão persistente com keep-alive e pool de conexões
+- HTTP2Transport: conexões HTTP/2 multiplexadas via httpx (opcional)
+
+Ambos registram, por requisição, o tempo de conexão (TCP + TLS) e o TTFB.
+As bibliotecas HTTP só são importadas ao criar o primeiro transporte, então
+importar este módulo não custa o carregamento do requests.
+"""
+
+import threading
+import time
+from functools import lru_cache
+
+DEFAULT_HEADERS = {
+    'Accept': 'application/vnd.github.v3+json'
+}
+
+# Tempo de conexão medido na thread que abriu o socket
+_local = threading.local()
+
+class TransportStats:
+    """Acumula métricas de conexão e TTFB sem guardar cada requisição"""
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self.connect_time = 0.0
+        self.ttfb_time = 0.0
+        self.total_time = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, connect, ttfb, total):
+        with self._lock:
+            self.requests += 1
+            if connect:
+                self.new_connections += 1
+                self.connect_time += connect
+            self.ttfb_time += ttfb
+            self.total_time += total
+
+    def summary(self):
+        """Resumo das métricas para relatórios e benchmarks"""
+        with self._lock:
+            requests_count = self.requests or 1
+            return {
+                'requests': self.requests,
+                'new_connections': self.new_connections,
+                'reused_connections': self.requests - self.new_connections,
+                'avg_connect_ms': self.connect_time / max(self.new_connections, 1) * 1000,
+                'connect_total_ms': self.connect_time * 1000,
+                'avg_ttfb_ms': self.ttfb_time / requests_count * 1000,
+                'avg_total_ms': self.total_time / requests_count * 1000,
+            }
+
+    def print_summary(self):
+        stats = self.summary()
+        if not stats['requests']:
+            return
+        print(f"🔌 Conexões: {stats['new_connections']} novas, {stats['reused_connections']} reutilizadas "
+              f"em {stats['requests']} requisições")
+        print(f"⏱️  Connect médio: {stats['avg_connect_ms']:.0f}ms | TTFB médio: {stats['avg_ttfb_ms']:.0f}ms "
+              f"| Total médio: {stats['avg_total_ms']:.0f}ms")
+
+@lru_cache(maxsize=None)
+def _timed_adapter_class():
+    """HTTPAdapter cujas conexões registram o tempo de handshake (requests/urllib3 só são importados aqui)"""
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class TimedHTTPConnection(HTTPConnection):
+        def connect(self):
+            start = time.perf_counter()
+            super().connect()
+            _local.connect_time = time.perf_counter() - start
+
+    class TimedHTTPSConnection(HTTPSConnection):
+        def connect(self):
+            start = time.perf_counter()
+            super().connect()
+            _local.connect_time = time.perf_counter() - start
+
+    class TimedHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = TimedHTTPConnection
+
+    class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = TimedHTTPSConnection
+
+    class TimedAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                'http': TimedHTTPConnectionPool,
+                'https': TimedHTTPSConnectionPool,
+            }
+
+    return TimedAdapter
+
+class RequestsTransport:
+    """Sessão requests persistente com keep-alive e pool de conexões"""
+
+    name = 'requests'
+
+    def __init__(self, headers=None, pool_size=10, timeout=30):
+        import requests
+
+        self.timeout = timeout
+        self.stats = TransportStats()
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.headers.update(headers or {})
+        adapter = _timed_adapter_class()(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, url, headers=None):
+        """GET reutilizando conexões; headers extras são mesclados aos da sessão"""
+        _local.connect_time = 0.0
+        start = time.perf_counter()
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        total = time.perf_counter() - start
+        connect = _local.connect_time
+        ttfb = response.elapsed.total_seconds()
+        response.timing = {'connect': connect, 'ttfb': ttfb, 'total': total}
+        self.stats.record(connect, ttfb, total)
+        return response
+
+    def close(self):
+        self.session.close()
+
+class HTTP2Transport:
+    """Cliente httpx com HTTP/2 multiplexado (requer: pip install 'httpx[http2]')"""
+
+    name = 'http2'
+
+    def __init__(self, headers=None, pool_size=10, timeout=30):
+        try:
+            import httpx
+        except ImportError:
+            raise RuntimeError("HTTP/2 requer o pacote httpx: pip install 'httpx[http2]'")
+
+        self.timeout = timeout
+        self.stats = TransportStats()
+        self.client = httpx.Client(
+            http2=True,
+            headers={**DEFAULT_HEADERS, **(headers or {})},
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            timeout=timeout,
+        )
+
+    def get(self, url, headers=None):
+        """GET multiplexado; o trace do httpcore fornece connect e TTFB"""
+        marks = {}
+
+        def trace(event_name, info):
+            marks[event_name] = time.perf_counter()
+
+        start = time.perf_counter()
+        response = self.client.get(url, headers=headers, extensions={'trace': trace})
+        total = time.perf_counter() - start
+
+        connect_start = marks.get('connection.connect_tcp.started')
+        connect_end = marks.get('connection.start_tls.complete') or marks.get('connection.connect_tcp.complete')
+        connect = connect_end - connect_start if connect_start and connect_end else 0.0
+        headers_done = (marks.get('http2.receive_response_headers.complete')
+                        or marks.get('http11.receive_response_headers.complete'))
+        ttfb = headers_done - start if headers_done else total
+
+        response.timing = {'connect': connect, 'ttfb': ttfb, 'total': total}
+        self.stats.record(connect, ttfb, total)
+        return response
+
+    def close(self):
+        self.client.close()
+
+BACKENDS = {
+    'requests': RequestsTransport,
+    'http2': HTTP2Transport,
+}
+
+def create_transport(backend='requests', headers=None, pool_size=10, timeout=30):
+    """Cria o transporte configurado (HTTP_BACKEND=requests|http2)"""
+    backend = (backend or 'requests').lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend HTTP desconhecido: {backend} (opções: {', '.join(BACKENDS)})")
+    return BACKENDS[backend](headers=headers, pool_size=pool_size, timeout=timeout)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Pool de processos worker pré-iniciados para os scans do servidor
+
+Cada worker é um interpretador iniciado uma vez, com o scanner e a biblioteca
+HTTP já importados. A configuração de um scan vai ao worker por um pipe e os
+eventos (resultados e termos concluídos) voltam pelo mesmo pipe conforme são
+produzidos. O worker mantém o transporte HTTP entre scans, então as conexões
+keep-alive também são reaproveitadas. Depois de max_jobs scans, ou se
+terminar inesperadamente, o worker é substituído por um novo.
+"""
+
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+
+from github_scan import Scanner
+from scan_jobs import run_scan
+from transport import create_transport
+
+# Intervalo, em segundos, para repassar cancelamentos enquanto espera eventos
+POLL_INTERVAL = 0.1
+
+def worker_main(conn, cancel_event, max_jobs):
+    """Loop do processo worker: recebe configurações e devolve os eventos de cada scan"""
+    sys.stdout = open(os.devnull, 'w', encoding='utf-8')  # O log do scanner não vai para o console do servidor
+    transport = None
+    try:
+        for _ in range(max_jobs):
+            try:
+                config = conn.recv()
+            except EOFError:
+                break
+            if config is None:
+                break
+            try:
+                if transport is None:
+                    transport = create_transport(config.http_backend, pool_size=config.concurrency)
+                scanner = Scanner(config, transport=transport)
+            except Exception as e:
+                conn.send({'type': 'end', 'status': 'failed', 'message': f'Erro na configuração: {str(e)}'})
+                continue
+            try:
+                status, message = run_scan(scanner, conn.send, cancel_event.is_set)
+            finally:
+                scanner.close()
+            conn.send({'type': 'end', 'status': status, 'message': message})
+    finally:
+        if transport is not None:
+            transport.close()
+        conn.close()
+
+def warm_up():
+    """Carrega no worker o que o primeiro scan usaria (requests, urllib3)"""
+    create_transport().close()
+
+def _worker_entry(conn, cancel_event, max_jobs):
+    # Ctrl+C no terminal chega ao grupo todo; quem encerra o worker é o servidor
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    warm_up()
+    worker_main(conn, cancel_event, max_jobs)
+
+class Worker:
+    """Processo worker com seu pipe e seu sinal de cancelamento"""
+
+    def __init__(self, context, max_jobs):
+        self.conn, child_conn = context.Pipe()
+        self.cancel_event = context.Event()
+        self.jobs = 0
+        self.broken = False
+        self.process = context.Process(target=_worker_entry, args=(child_conn, self.cancel_event, max_jobs),
+                                       daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def stop(self, timeout=5):
+        """Pede ao worker para sair e o encerra se não sair a tempo"""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+class WorkerPool:
+    """Pool de tamanho fixo de workers pré-iniciados, reciclados a cada max_jobs scans"""
+
+    def __init__(self, size=2, max_jobs=50):
+        self.size = max(1, size)
+        self.max_jobs = max(1, max_jobs)
+        # spawn: processos limpos, sem herdar threads e locks do servidor
+        self._context = multiprocessing.get_context('spawn')
+        self._idle = queue.Queue()
+        self._workers = set()
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self):
+        worker = Worker(self._context, self.max_jobs)
+        self._workers.add(worker)
+        return worker
+
+    def _replace(self, worker):
+        self._workers.discard(worker)
+        worker.stop()
+        return self._spawn()
+
+    def run(self, config, emit, cancelled):
+        """Executa um scan em um worker livre, repassando os eventos a emit; devolve (status, mensagem)"""
+        worker = self._idle.get()
+        try:
+            worker.cancel_event.clear()
+            worker.conn.send(config)
+            worker.jobs += 1
+            while True:
+                if cancelled():
+                    worker.cancel_event.set()
+                if not worker.conn.poll(POLL_INTERVAL):
+                    if not worker.process.is_alive():
+                        raise EOFError
+                    continue
+                event = worker.conn.recv()
+                if event['type'] == 'end':
+                    return event['status'], event['message']
+                emit(event)
+        except (EOFError, OSError):
+            worker.broken = True
+            return 'failed', 'O worker do scanner terminou inesperadamente'
+        finally:
+            if worker.broken or worker.jobs >= self.max_jobs:
+                worker = self._replace(worker)
+            self._idle.put(worker)
+
+    def close(self):
+        """Encerra todos os workers"""
+        for worker in list(self._workers):
+            worker.stop()
+        self._workers.clear()